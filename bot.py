@@ -4,39 +4,118 @@ Loads cogs, syncs slash commands, and handles bot lifecycle.
 """
 
 import asyncio
+import atexit
+import hashlib
+import json
+import logging
+import logging.handlers
 import os
+import queue
+import shutil
 import sys
 import signal
-from typing import Optional
+from pathlib import Path
+from typing import Optional, Dict, Any, List
 
 import discord
 from discord.ext import commands
-from dotenv import load_dotenv
 
 
-# Load environment variables
-load_dotenv()
+# Logging goes through a queue so stdout writes happen on the listener
+# thread instead of blocking the event loop
+_log_queue: queue.Queue = queue.Queue()
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)-8s %(name)s: %(message)s'))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logger = logging.getLogger('musicbot')
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+
+# Load environment variables from .env, unless the environment already
+# provides them (e.g. injected by a container orchestrator)
+if not os.environ.get('BOT_TOKEN'):
+    from dotenv import load_dotenv
+    load_dotenv()
 
 # Bot configuration
 BOT_TOKEN = os.getenv('BOT_TOKEN')
-GUILD_ID = os.getenv('GUILD_ID')  # Optional: for faster dev command syncing
+GUILD_ID = os.getenv('GUILD_ID')  # Optional: dev guild for instant command syncing (with DEV_MODE=1)
 OWNER_ID = os.getenv('OWNER_ID')  # Optional: bot owner ID
 
+FFMPEG_PATH = os.getenv('FFMPEG_PATH', 'ffmpeg')
+DEV_MODE = os.getenv('DEV_MODE') == '1'  # Sync commands to GUILD_ID only, instead of globally
+
+# Slash command sync policy: safe (sync only when commands changed), bulk (always sync), off (never sync)
+COMMAND_SYNC_POLICY = os.getenv('COMMAND_SYNC_POLICY', 'safe').lower()
+COPY_GLOBAL_TO_DEV = os.getenv('COPY_GLOBAL_TO_DEV', '1') == '1'  # Mirror global commands into GUILD_ID
+SYNC_TIMEOUT = float(os.getenv('SYNC_TIMEOUT', '30'))  # Seconds before giving up on a sync
+
 if not BOT_TOKEN:
-    print("ERROR: BOT_TOKEN not found in environment variables!")
-    print("Please create a .env file with your bot token.")
+    logger.error("BOT_TOKEN not found in environment variables!")
+    logger.error("Please create a .env file with your bot token.")
     sys.exit(1)
 
 
+def _canonicalize_option_payload(option: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a command option so local and remote payloads compare equal."""
+    canonical = {
+        'type': option.get('type'),
+        'name': option.get('name'),
+        'description': option.get('description', ''),
+        'required': bool(option.get('required', False)),
+        'autocomplete': bool(option.get('autocomplete', False)),
+        'choices': [
+            {'name': choice.get('name'), 'value': choice.get('value')}
+            for choice in option.get('choices') or []
+        ],
+        'options': [_canonicalize_option_payload(sub) for sub in option.get('options') or []],
+        'channel_types': sorted(option.get('channel_types') or []),
+    }
+    for key in ('min_value', 'max_value', 'min_length', 'max_length'):
+        if option.get(key) is not None:
+            canonical[key] = option[key]
+    return canonical
+
+
+def _canonicalize_app_command_payload(payload: Dict[str, Any], desired: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize an application command payload for diffing.
+    
+    Discord populates fields such as integration_types and contexts even when
+    we never sent them, so those are only compared when the desired payload
+    sets them. Missing nsfw/dm_permission values are filled with Discord's defaults.
+    """
+    permissions = payload.get('default_member_permissions')
+    canonical = {
+        'type': payload.get('type', 1),
+        'name': payload['name'],
+        'description': payload.get('description', ''),
+        'options': [_canonicalize_option_payload(option) for option in payload.get('options') or []],
+        'default_member_permissions': str(permissions) if permissions is not None else None,
+        'nsfw': bool(payload.get('nsfw', False)),
+        'dm_permission': bool(payload.get('dm_permission', True)),
+    }
+    for key in ('integration_types', 'contexts'):
+        if desired.get(key) is not None:
+            canonical[key] = sorted(payload.get(key) or [])
+    return canonical
+
+
 class MusicBot(commands.Bot):
     """Custom bot class with startup and shutdown handlers."""
     
     def __init__(self):
-        # Bot intents
-        intents = discord.Intents.default()
-        intents.message_content = True  # Required for some functionality
-        intents.voice_states = True  # Required for voice
-        intents.guilds = True
+        # Bot intents - only what the bot uses, so unused gateway events
+        # (typing, presences, reactions, ...) are never sent
+        intents = discord.Intents(
+            guilds=True,
+            voice_states=True,  # Required for voice
+            guild_messages=True,  # Keeps the control panel at the bottom of the channel
+            message_content=True,  # Required for some functionality
+        )
         
         super().__init__(
             command_prefix="!",  # Prefix is not used since we only use slash commands
@@ -44,73 +123,257 @@ class MusicBot(commands.Bot):
             help_command=None,  # Disable default help command
         )
         
-        self.initial_extensions = [
+        # Critical extensions load in setup_hook; deferred ones load after the
+        # gateway is ready so heavy imports (yt-dlp, voice) don't delay READY
+        self.critical_extensions: List[str] = []
+        self.deferred_extensions = [
             'cogs.music',
         ]
+        self._deferred_task: Optional[asyncio.Task] = None
+        self._ready_once = False
+        
+        # Presence activities, built once and reused for every presence update
+        self._startup_activity = discord.Game(name="Starting up...")
+        self._default_activity = discord.Activity(
+            type=discord.ActivityType.listening,
+            name="/play to add music"
+        )
+        
+        # Dev guild for command syncing, parsed once. Dev mode syncs only to
+        # GUILD_ID and production syncs only globally - never both, since
+        # mixing the two shows every command twice in that guild
+        self._dev_guild = discord.Object(id=int(GUILD_ID)) if DEV_MODE and GUILD_ID else None
+        self._sync_state_path = Path(os.getenv('SYNC_STATE_FILE', '.sync_state.json'))
+        self._sync_task: Optional[asyncio.Task] = None
+        self._shutdown_event = asyncio.Event()
     
     async def setup_hook(self):
         """
         Called when the bot is starting up.
-        Load cogs and sync slash commands.
+        Load critical cogs; the rest load once the bot is ready.
         """
-        print("Loading cogs...")
+        # Fail fast on missing voice dependencies instead of on the first /play
+        await self._preflight()
         
-        # Load all cogs
-        for extension in self.initial_extensions:
+        logger.info("Loading cogs...")
+        
+        # Load critical cogs concurrently
+        await asyncio.gather(*map(self._safe_load, self.critical_extensions), return_exceptions=True)
+    
+    async def _preflight(self):
+        """Check that PyNaCl and ffmpeg are available for voice playback."""
+        def check():
             try:
-                await self.load_extension(extension)
-                print(f"✓ Loaded {extension}")
-            except Exception as e:
-                print(f"✗ Failed to load {extension}: {e}")
+                import nacl  # noqa: F401
+                has_nacl = True
+            except ImportError:
+                has_nacl = False
+            return has_nacl, shutil.which(FFMPEG_PATH)
+        
+        has_nacl, ffmpeg = await asyncio.to_thread(check)
+        if not has_nacl:
+            raise RuntimeError("PyNaCl is not installed - voice will not work. Run: pip install PyNaCl")
+        if not ffmpeg:
+            raise RuntimeError(
+                f"ffmpeg executable '{FFMPEG_PATH}' not found - install ffmpeg or set FFMPEG_PATH in .env"
+            )
+        logger.info("✓ Preflight passed (PyNaCl, ffmpeg at %s)", ffmpeg)
+    
+    async def _load_deferred(self):
+        """Load deferred cogs, then sync slash commands and announce availability."""
+        await asyncio.gather(*map(self._safe_load, self.deferred_extensions), return_exceptions=True)
+        
+        # Sync slash commands in the background now that every command is registered
+        self._sync_task = asyncio.create_task(self._sync_commands(), name="slash-sync")
+        self._sync_task.add_done_callback(self._on_sync_done)
+        
+        await self.change_presence(activity=self._default_activity)
+    
+    async def _sync_commands(self):
+        """Sync slash commands according to COMMAND_SYNC_POLICY."""
+        logger.info("Syncing slash commands...")
+        if COMMAND_SYNC_POLICY == 'off':
+            logger.info("Skipped sync (COMMAND_SYNC_POLICY=off)")
+            return
         
-        # Sync slash commands
-        print("\nSyncing slash commands...")
         try:
-            if GUILD_ID:
-                # Sync to specific guild for faster testing (dev mode)
-                guild = discord.Object(id=int(GUILD_ID))
+            # Sync to specific guild for faster testing (dev mode)
+            guild = self._dev_guild
+            copy_global = guild is not None and COPY_GLOBAL_TO_DEV
+            
+            # Skip the sync round-trip when nothing changed since the last run
+            command_hash = self._compute_command_hash(guild, include_global=copy_global)
+            if COMMAND_SYNC_POLICY == 'safe' and self._read_command_hash(guild) == command_hash:
+                logger.info("Skipped sync (unchanged)")
+                return
+            
+            # Only mirror global commands into the dev guild when we're actually syncing
+            if copy_global:
+                global_count = len(self.tree.get_commands())
+                if global_count:
+                    logger.warning(
+                        "⚠ DEV_MODE mirrors %d global commands into guild %s; if this application "
+                        "also has globally synced commands they will appear twice. "
+                        "Use a separate bot application for development.",
+                        global_count, GUILD_ID
+                    )
                 self.tree.copy_global_to(guild=guild)
-                await self.tree.sync(guild=guild)
-                print(f"✓ Synced commands to guild {GUILD_ID}")
+            
+            if COMMAND_SYNC_POLICY == 'bulk':
+                sync = self.tree.sync(guild=guild)
+            else:
+                sync = self._reconcile_commands(guild)
+            await asyncio.wait_for(sync, timeout=SYNC_TIMEOUT)
+            self._write_command_hash(guild, command_hash)
+            
+            if guild:
+                logger.info("✓ Synced commands to guild %s", GUILD_ID)
             else:
                 # Sync globally (takes up to 1 hour to propagate)
-                await self.tree.sync()
-                print("✓ Synced commands globally (may take up to 1 hour)")
+                logger.info("✓ Synced commands globally (may take up to 1 hour)")
+        except asyncio.TimeoutError:
+            # Hash is not updated, so the next start retries the sync
+            logger.warning("⚠ Sync timed out, continuing with cached commands")
         except Exception as e:
-            print(f"✗ Failed to sync commands: {e}")
+            logger.error("✗ Failed to sync commands: %s", e)
+    
+    def _on_sync_done(self, task: asyncio.Task):
+        """Surface errors from the background sync task."""
+        if task.cancelled():
+            logger.warning("✗ Command sync was cancelled")
+        elif task.exception():
+            logger.error("✗ Command sync failed: %s", task.exception())
+    
+    async def _safe_load(self, extension: str):
+        """Load a single extension, reporting (not raising) failures."""
+        try:
+            await self.load_extension(extension)
+            logger.info("✓ Loaded %s", extension)
+        except Exception as e:
+            logger.error("✗ Failed to load %s: %s", extension, e)
+    
+    async def _reconcile_commands(self, guild: Optional[discord.abc.Snowflake]):
+        """Create, edit, or delete only the commands that differ from Discord's copy."""
+        app_id = self.application_id
+        if guild:
+            remote = await self.http.get_guild_commands(app_id, guild.id)
+        else:
+            remote = await self.http.get_global_commands(app_id)
+        
+        desired = {}
+        for cmd in self.tree.get_commands(guild=guild):
+            payload = cmd.to_dict(self.tree)
+            desired[(payload.get('type', 1), payload['name'])] = payload
+        current = {(payload.get('type', 1), payload['name']): payload for payload in remote}
+        
+        created = edited = deleted = 0
+        for key, payload in desired.items():
+            existing = current.get(key)
+            if existing is None:
+                if guild:
+                    await self.http.upsert_guild_command(app_id, guild.id, payload)
+                else:
+                    await self.http.upsert_global_command(app_id, payload)
+                created += 1
+            elif _canonicalize_app_command_payload(existing, payload) != _canonicalize_app_command_payload(payload, payload):
+                if guild:
+                    await self.http.edit_guild_command(app_id, guild.id, existing['id'], payload)
+                else:
+                    await self.http.edit_global_command(app_id, existing['id'], payload)
+                edited += 1
+        
+        for key, existing in current.items():
+            if key not in desired:
+                if guild:
+                    await self.http.delete_guild_command(app_id, guild.id, existing['id'])
+                else:
+                    await self.http.delete_global_command(app_id, existing['id'])
+                deleted += 1
+        
+        logger.info("✓ Reconciled commands: %d created, %d edited, %d deleted", created, edited, deleted)
+    
+    def _compute_command_hash(self, guild: Optional[discord.abc.Snowflake], include_global: bool = False) -> str:
+        """Hash the canonical command payloads for the given sync scope."""
+        payloads = {cmd.name: cmd.to_dict(self.tree) for cmd in self.tree.get_commands(guild=guild)}
+        if include_global:
+            # Same result copy_global_to would produce, without mutating the tree
+            payloads.update({cmd.name: cmd.to_dict(self.tree) for cmd in self.tree.get_commands()})
+        payloads = list(payloads.values())
+        payloads.sort(key=lambda payload: payload['name'])
+        scope = self._sync_scope(guild)
+        canonical = json.dumps({'scope': scope, 'commands': payloads}, sort_keys=True)
+        return hashlib.md5(canonical.encode('utf-8')).hexdigest()
+    
+    def _load_sync_state(self) -> Dict[str, str]:
+        """Load the per-scope hashes of the last successfully synced command sets."""
+        try:
+            state = json.loads(self._sync_state_path.read_text())
+            return state if isinstance(state, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _read_command_hash(self, guild: Optional[discord.abc.Snowflake]) -> Optional[str]:
+        """Read the last synced command hash for a sync scope."""
+        return self._load_sync_state().get(self._sync_scope(guild))
+    
+    def _write_command_hash(self, guild: Optional[discord.abc.Snowflake], command_hash: str):
+        """Persist the synced hash for one scope (write to temp file, then swap in)."""
+        state = self._load_sync_state()
+        state[self._sync_scope(guild)] = command_hash
+        try:
+            temp_path = self._sync_state_path.with_name(self._sync_state_path.name + '.tmp')
+            temp_path.write_text(json.dumps(state, indent=2, sort_keys=True))
+            temp_path.replace(self._sync_state_path)
+        except OSError as e:
+            logger.error("✗ Failed to save command sync state: %s", e)
+    
+    @staticmethod
+    def _sync_scope(guild: Optional[discord.abc.Snowflake]) -> str:
+        """Key for a sync scope in the sync state file."""
+        return str(guild.id) if guild else 'global'
     
     async def on_ready(self):
         """Called when bot is ready and connected."""
-        print(f"\n{'='*50}")
-        print(f"Bot is ready!")
-        print(f"Logged in as: {self.user.name} (ID: {self.user.id})")
-        print(f"Connected to {len(self.guilds)} guild(s)")
-        print(f"{'='*50}\n")
-        
-        # Set bot status
-        activity = discord.Activity(
-            type=discord.ActivityType.listening,
-            name="/play to add music"
-        )
-        await self.change_presence(activity=activity)
+        # on_ready also fires on gateway reconnects; only run startup work once
+        if self._ready_once:
+            return
+        self._ready_once = True
+        
+        logger.info("Bot is ready!")
+        logger.info("Logged in as: %s (ID: %s)", self.user.name, self.user.id)
+        logger.info("Connected to %d guild(s)", len(self.guilds))
+        
+        # Load deferred cogs; status switches to "/play" when they're in
+        await self.change_presence(activity=self._startup_activity)
+        self._deferred_task = asyncio.create_task(self._load_deferred())
     
     async def on_command_error(self, ctx, error):
         """Global error handler for commands."""
         if isinstance(error, commands.CommandNotFound):
             return  # Ignore command not found errors
         
-        print(f"Command error: {error}")
+        logger.error("Command error: %s", error)
+    
+    async def _safe_disconnect(self, voice_client: discord.VoiceProtocol):
+        """Force-disconnect a voice client, ignoring connection failures during shutdown."""
+        try:
+            await voice_client.disconnect(force=True)
+        except (discord.ConnectionClosed, asyncio.TimeoutError, OSError) as e:
+            logger.debug("voice disconnect: %s", e)
     
     async def close(self):
         """Graceful shutdown handler."""
-        print("\nShutting down bot...")
+        logger.info("Shutting down bot...")
         
-        # Disconnect all voice clients
-        for voice_client in self.voice_clients:
-            try:
-                await voice_client.disconnect()
-            except:
-                pass
+        # Don't leave a half-finished command sync running
+        if self._sync_task and not self._sync_task.done():
+            self._sync_task.cancel()
+        
+        # Disconnect all voice clients concurrently
+        await asyncio.gather(
+            *(self._safe_disconnect(vc) for vc in list(self.voice_clients)),
+            return_exceptions=True
+        )
         
         # Clean up music cog and temp files
         music_cog = self.get_cog('Music')
@@ -118,40 +381,67 @@ class MusicBot(commands.Bot):
             try:
                 await music_cog.cog_unload()
             except Exception as e:
-                print(f"Error during music cog cleanup: {e}")
+                logger.error("Error during music cog cleanup: %s", e)
         
         await super().close()
-        print("Bot shutdown complete.")
+        logger.info("Bot shutdown complete.")
 
 
-def signal_handler(signum, frame):
-    """Handle shutdown signals."""
-    print(f"\nReceived signal {signum}, shutting down gracefully...")
-    sys.exit(0)
+def signal_handler(bot: MusicBot, signum: int):
+    """Handle shutdown signals by waking main() to run the graceful close."""
+    logger.info("Received signal %s, shutting down gracefully...", signum)
+    bot._shutdown_event.set()
 
 
 async def main():
     """Main function to run the bot."""
-    # Register signal handlers for graceful shutdown
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-    
     # Create and start bot
     bot = MusicBot()
     
+    # Register signal handlers for graceful shutdown
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, signal_handler, bot, sig)
+        except NotImplementedError:
+            # Windows: no loop signal handlers, so hand the signal over to the loop thread
+            signal.signal(sig, lambda signum, frame: loop.call_soon_threadsafe(signal_handler, bot, signum))
+    
+    # Run until the bot stops on its own or a shutdown is requested
+    start_task = asyncio.create_task(bot.start(BOT_TOKEN), name="bot-start")
+    shutdown_task = asyncio.create_task(bot._shutdown_event.wait(), name="shutdown-wait")
     try:
-        await bot.start(BOT_TOKEN)
-    except KeyboardInterrupt:
-        print("\nKeyboard interrupt received.")
-    except Exception as e:
-        print(f"Fatal error: {e}")
+        await asyncio.wait({start_task, shutdown_task}, return_when=asyncio.FIRST_COMPLETED)
+        if start_task.done() and not start_task.cancelled() and start_task.exception():
+            logger.error("Fatal error: %s", start_task.exception())
     finally:
+        shutdown_task.cancel()
         if not bot.is_closed():
             await bot.close()
+        start_task.cancel()
+        await asyncio.gather(start_task, return_exceptions=True)
 
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop where available (not supported on Windows)
     try:
-        asyncio.run(main())
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
+    # Create the event loop once; a restart supervisor can reuse it across runs
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_until_complete(main())
     except KeyboardInterrupt:
-        print("\nBot stopped by user.")
+        logger.info("Bot stopped by user.")
+    finally:
+        # Cancel leftover background tasks the way asyncio.run() would
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
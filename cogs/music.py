@@ -4,11 +4,14 @@ Handles voice playback, queue management, and interactive controls.
 """
 
 import asyncio
+import functools
+import itertools
 import random
 import os
 import re
 import time
-from typing import Optional, List, Dict, Any, Tuple
+from collections import deque
+from typing import Optional, List, Dict, Any, Tuple, Deque, Union
 from enum import Enum
 from datetime import datetime
 
@@ -19,284 +22,359 @@ from discord.ext import commands, tasks
 from utils.yt import ytdl_source, FFMPEG_OPTIONS, FFMPEG_PCM_OPTIONS, FFMPEG_LOCAL_OPTIONS, YTDLSource
 
 
+# Configuration read once at import instead of per guild state
+_admin_log_channel_id = os.getenv('ADMIN_LOG_CHANNEL_ID', '')
+ADMIN_LOG_CHANNEL_ID = int(_admin_log_channel_id) if _admin_log_channel_id.isdigit() else None
+QUEUE_TIMEOUT = int(os.getenv('QUEUE_TIMEOUT', '300'))
+CHANNEL_NAME_UPDATES = os.getenv('CHANNEL_NAME_UPDATES', 'true').lower() == 'true'
+HISTORY_LIMIT = 50  # Tracks kept in per-guild play history
+EMBED_UPDATE_INTERVAL = 5.0  # Seconds between now playing embed refreshes
+
+# Playlist URLs: a list= query parameter or a /playlist path
+_PLAYLIST_RE = re.compile(r'[?&]list=|/playlist\b', re.IGNORECASE)
+
+# Monotonic clock for every elapsed-time calculation; bound once so the hot
+# progress/session getters skip the attribute lookup
+_now = time.monotonic
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_time(seconds: int) -> str:
+    """Format seconds as '1h 2m 3s' or '2m 3s' (admin logs and /pl-info)."""
+    hours = seconds // 3600
+    minutes = (seconds % 3600) // 60
+    secs = seconds % 60
+    if hours > 0:
+        return f"{hours}h {minutes}m {secs}s"
+    return f"{minutes}m {secs}s"
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_clock(seconds: int) -> str:
+    """Format seconds as M:SS or H:MM:SS (used in player embeds)."""
+    if seconds < 0:
+        seconds = 0
+    hours = seconds // 3600
+    minutes = (seconds % 3600) // 60
+    secs = seconds % 60
+    if hours > 0:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
+
+
+@functools.lru_cache(maxsize=2048)
+def _progress_bar(filled: int, length: int) -> str:
+    """Build a progress bar with `filled` of `length` cells filled."""
+    return f"`[{'█' * filled}{'░' * (length - filled)}]`"
+
+
+# Every possible bar at the default length, indexed by filled cell count
+_PROGRESS_BARS_20 = tuple(_progress_bar(i, 20) for i in range(21))
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Clip `text` to `limit` characters, adding an ellipsis only when something was cut."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+@functools.lru_cache(maxsize=64)
+def _action_names(action: str) -> Tuple[str, str]:
+    """Return (lookup key, display title) for an admin log action/event name."""
+    return action.lower(), action.title()
+
+
 class AdminLogger:
-    """Handles all administrative logging for the music bot."""
+    """Handles all administrative logging for the music bot.
+    
+    Log embeds are queued and sent by a single background task that packs
+    up to 10 embeds into each message, so bursts of events (e.g. a playlist
+    being queued) cost a handful of API calls instead of one per event.
+    The log_* helpers only enqueue, so they are plain methods and callers
+    never wait on the admin channel.
+    """
+    
+    MAX_EMBEDS_PER_MESSAGE = 10  # Discord limit per message
+    MAX_EMBED_CHARS_PER_MESSAGE = 6000  # Discord limit across all embeds in a message
+    FLUSH_INTERVAL = 2.0  # Seconds to let a burst accumulate before sending
+    
+    # Embed colors, built once at import rather than on every log call
+    _PLAYBACK_COLORS = {
+        'pause': discord.Color.yellow(),
+        'resume': discord.Color.green(),
+        'stop': discord.Color.red(),
+        'loop': discord.Color.blue()
+    }
+    _VOICE_COLORS = {
+        'joined': discord.Color.green(),
+        'left': discord.Color.orange(),
+        'disconnected': discord.Color.red(),
+        'kicked': discord.Color.dark_red()
+    }
+    _DEFAULT_COLOR = discord.Color.greyple()
     
     def __init__(self, bot):
         self.bot = bot
-        # Read admin log channel ID from environment variable
-        admin_channel_id = os.getenv('ADMIN_LOG_CHANNEL_ID')
-        self.admin_channel_id = int(admin_channel_id) if admin_channel_id and admin_channel_id.isdigit() else None
+        self.admin_channel_id = ADMIN_LOG_CHANNEL_ID
+        self.enabled = self.admin_channel_id is not None
+        self._channel: Optional[discord.TextChannel] = None  # Resolved on first send
+        
+        # Outgoing embeds, drained by a single background task
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
     
     async def get_admin_channel(self) -> Optional[discord.TextChannel]:
-        """Get the admin log channel."""
-        if not self.admin_channel_id:
+        """Get the admin log channel (resolved once, then cached)."""
+        if not self.enabled:
             # No admin channel configured
             return None
         
+        if self._channel is not None:
+            return self._channel
+        
         try:
             channel = self.bot.get_channel(self.admin_channel_id)
             if not channel:
                 channel = await self.bot.fetch_channel(self.admin_channel_id)
+            self._channel = channel
             return channel
         except Exception as e:
             print(f"[AdminLog] Error getting admin channel {self.admin_channel_id}: {e}")
             return None
     
-    async def log(self, title: str, description: str, color: discord.Color, fields: List[Dict] = None, guild: discord.Guild = None):
-        """Send a log message to the admin channel."""
+    def _new_embed(self, title: str, description: str, color: discord.Color, guild: discord.Guild = None) -> discord.Embed:
+        """Create a log embed, with the server field first if a guild is given."""
+        embed = discord.Embed(
+            title=title,
+            description=description,
+            color=color,
+            timestamp=discord.utils.utcnow()
+        )
+        
+        # Add guild information if provided
+        if guild:
+            embed.add_field(name="🏰 Server", value=f"{guild.name} (`{guild.id}`)", inline=False)
+        return embed
+    
+    def log(self, embed: discord.Embed):
+        """Queue a log embed for the admin channel."""
+        if not self.enabled:
+            return
+        
         try:
+            self._queue.put_nowait(embed)
+            if self._worker is None or self._worker.done():
+                self._worker = asyncio.create_task(self._drain())
+            
+        except Exception as e:
+            print(f"[AdminLog] Error queueing log: {e}")
+    
+    async def _drain(self):
+        """Send queued embeds to the admin channel, batching as many as fit in one message."""
+        carry: Optional[discord.Embed] = None
+        try:
+            while True:
+                if carry is None:
+                    embed = await self._queue.get()
+                    # Give the rest of a burst a moment to arrive so it shares this message
+                    await asyncio.sleep(self.FLUSH_INTERVAL)
+                else:
+                    embed = carry
+                carry = None
+                batch = [embed]
+                batch_chars = len(embed)
+                while len(batch) < self.MAX_EMBEDS_PER_MESSAGE and not self._queue.empty():
+                    next_embed = self._queue.get_nowait()
+                    if batch_chars + len(next_embed) > self.MAX_EMBED_CHARS_PER_MESSAGE:
+                        carry = next_embed  # Starts the next message
+                        break
+                    batch.append(next_embed)
+                    batch_chars += len(next_embed)
+                
+                try:
+                    await self._send_batch(batch)
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+        except asyncio.CancelledError:
+            pass
+    
+    async def _send_batch(self, batch: List[discord.Embed]):
+        """Send one message worth of embeds, waiting out a rate limit once if needed."""
+        for attempt in range(2):
             channel = await self.get_admin_channel()
             if not channel:
                 return
-            
-            embed = discord.Embed(
-                title=title,
-                description=description,
-                color=color,
-                timestamp=datetime.utcnow()
-            )
-            
-            # Add guild information if provided
-            if guild:
-                embed.add_field(name="🏰 Server", value=f"{guild.name} (`{guild.id}`)", inline=False)
-            
-            # Add custom fields
-            if fields:
-                for field in fields:
-                    embed.add_field(
-                        name=field.get('name', 'Field'),
-                        value=field.get('value', 'N/A'),
-                        inline=field.get('inline', True)
-                    )
-            
-            await channel.send(embed=embed)
-            
-        except Exception as e:
-            print(f"[AdminLog] Error sending log: {e}")
+            try:
+                await channel.send(embeds=batch)
+                return
+            except discord.NotFound as e:
+                # Channel was deleted; resolve it again next time
+                self._channel = None
+                print(f"[AdminLog] Admin channel {self.admin_channel_id} not found: {e}")
+                return
+            except discord.HTTPException as e:
+                if e.status == 429 and attempt == 0:
+                    retry_after = getattr(e, 'retry_after', None) or 1.0
+                    await asyncio.sleep(retry_after + 1)
+                    continue
+                print(f"[AdminLog] Error sending log: {e}")
+                return
+            except Exception as e:
+                print(f"[AdminLog] Error sending log: {e}")
+                return
     
-    async def log_track_play(self, guild: discord.Guild, track, requester: discord.Member, session_position: int):
+    async def close(self, timeout: float = 5.0):
+        """Flush queued logs (up to timeout seconds), then stop the background sender."""
+        if self._worker and not self._worker.done():
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=timeout)
+            except asyncio.TimeoutError:
+                print(f"[AdminLog] Dropping {self._queue.qsize()} unsent logs on shutdown")
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+    
+    def log_track_play(self, guild: discord.Guild, track, requester: discord.Member, session_position: int):
         """Log when a track starts playing."""
-        fields = [
-            {'name': '🎵 Track', 'value': track.title[:100], 'inline': False},
-            {'name': '📺 Channel', 'value': track.uploader[:50], 'inline': True},
-            {'name': '⏱️ Duration', 'value': track.duration_str, 'inline': True},
-            {'name': '👤 Requested By', 'value': f"{requester.mention} ({requester.display_name})", 'inline': True},
-            {'name': '📊 Session Position', 'value': f"#{session_position}", 'inline': True},
-            {'name': '🔗 URL', 'value': f"[YouTube]({track.webpage_url})", 'inline': False}
-        ]
-        
-        await self.log(
-            title="▶️ Track Started",
-            description="A new track has started playing",
-            color=discord.Color.green(),
-            fields=fields,
-            guild=guild
-        )
+        if not self.enabled:
+            return
+        
+        embed = self._new_embed("▶️ Track Started", "A new track has started playing", discord.Color.green(), guild)
+        embed.add_field(name='🎵 Track', value=track.title_100, inline=False)
+        embed.add_field(name='📺 Channel', value=track.uploader_50, inline=True)
+        embed.add_field(name='⏱️ Duration', value=track.duration_str, inline=True)
+        embed.add_field(name='👤 Requested By', value=f"{requester.mention} ({requester.display_name})", inline=True)
+        embed.add_field(name='📊 Session Position', value=f"#{session_position}", inline=True)
+        embed.add_field(name='🔗 URL', value=f"[YouTube]({track.webpage_url})", inline=False)
+        self.log(embed)
     
-    async def log_track_skip(self, guild: discord.Guild, track, user: discord.Member, reason: str = "Manual skip"):
+    def log_track_skip(self, guild: discord.Guild, track, user: discord.Member, reason: str = "Manual skip"):
         """Log when a track is skipped."""
-        fields = [
-            {'name': '🎵 Skipped Track', 'value': track.title[:100], 'inline': False},
-            {'name': '👤 Skipped By', 'value': f"{user.mention} ({user.display_name})", 'inline': True},
-            {'name': '❓ Reason', 'value': reason, 'inline': True}
-        ]
-        
-        await self.log(
-            title="⏭️ Track Skipped",
-            description="A track was skipped",
-            color=discord.Color.orange(),
-            fields=fields,
-            guild=guild
-        )
+        if not self.enabled:
+            return
+        
+        embed = self._new_embed("⏭️ Track Skipped", "A track was skipped", discord.Color.orange(), guild)
+        embed.add_field(name='🎵 Skipped Track', value=track.title_100, inline=False)
+        embed.add_field(name='👤 Skipped By', value=f"{user.mention} ({user.display_name})", inline=True)
+        embed.add_field(name='❓ Reason', value=reason, inline=True)
+        self.log(embed)
     
-    async def log_playback_action(self, guild: discord.Guild, action: str, user: discord.Member, details: str = None):
+    def log_playback_action(self, guild: discord.Guild, action: str, user: discord.Member, details: str = None):
         """Log playback actions (pause, resume, stop, loop, etc.)."""
-        fields = [
-            {'name': '🎮 Action', 'value': action, 'inline': True},
-            {'name': '👤 User', 'value': f"{user.mention} ({user.display_name})", 'inline': True}
-        ]
-        
-        if details:
-            fields.append({'name': '📝 Details', 'value': details, 'inline': False})
+        if not self.enabled:
+            return
         
         # Color based on action
-        color_map = {
-            'pause': discord.Color.yellow(),
-            'resume': discord.Color.green(),
-            'stop': discord.Color.red(),
-            'loop': discord.Color.blue()
-        }
-        color = color_map.get(action.lower(), discord.Color.greyple())
+        key, title = _action_names(action)
+        color = self._PLAYBACK_COLORS.get(key, self._DEFAULT_COLOR)
         
-        await self.log(
-            title=f"🎮 Playback Action: {action.title()}",
-            description="Playback state changed",
-            color=color,
-            fields=fields,
-            guild=guild
-        )
+        embed = self._new_embed(f"🎮 Playback Action: {title}", "Playback state changed", color, guild)
+        embed.add_field(name='🎮 Action', value=action, inline=True)
+        embed.add_field(name='👤 User', value=f"{user.mention} ({user.display_name})", inline=True)
+        if details:
+            embed.add_field(name='📝 Details', value=details, inline=False)
+        self.log(embed)
     
-    async def log_queue_update(self, guild: discord.Guild, action: str, track, user: discord.Member):
+    def log_queue_update(self, guild: discord.Guild, action: str, track, user: discord.Member):
         """Log queue modifications."""
-        fields = [
-            {'name': '📝 Action', 'value': action, 'inline': True},
-            {'name': '🎵 Track', 'value': track.title[:100], 'inline': False},
-            {'name': '👤 User', 'value': f"{user.mention} ({user.display_name})", 'inline': True}
-        ]
-        
-        await self.log(
-            title="📋 Queue Updated",
-            description=f"Queue {action.lower()}",
-            color=discord.Color.blue(),
-            fields=fields,
-            guild=guild
-        )
+        if not self.enabled:
+            return
+        
+        embed = self._new_embed("📋 Queue Updated", f"Queue {action.lower()}", discord.Color.blue(), guild)
+        embed.add_field(name='📝 Action', value=action, inline=True)
+        embed.add_field(name='🎵 Track', value=track.title_100, inline=False)
+        embed.add_field(name='👤 User', value=f"{user.mention} ({user.display_name})", inline=True)
+        self.log(embed)
     
-    async def log_voice_event(self, guild: discord.Guild, event: str, channel: discord.VoiceChannel = None, user: discord.Member = None):
+    def log_voice_event(self, guild: discord.Guild, event: str, channel: discord.VoiceChannel = None, user: discord.Member = None):
         """Log bot join/leave events."""
-        fields = []
+        if not self.enabled:
+            return
         
-        if channel:
-            fields.append({'name': '📢 Channel', 'value': f"{channel.mention} ({channel.name})", 'inline': True})
+        key, title = _action_names(event)
+        color = self._VOICE_COLORS.get(key, self._DEFAULT_COLOR)
         
+        embed = self._new_embed(f"🔊 Voice Event: {title}", f"Bot {event} voice channel", color, guild)
+        if channel:
+            embed.add_field(name='📢 Channel', value=f"{channel.mention} ({channel.name})", inline=True)
         if user:
-            fields.append({'name': '👤 Triggered By', 'value': f"{user.mention} ({user.display_name})", 'inline': True})
-        
-        color_map = {
-            'joined': discord.Color.green(),
-            'left': discord.Color.orange(),
-            'disconnected': discord.Color.red(),
-            'kicked': discord.Color.dark_red()
-        }
-        color = color_map.get(event.lower(), discord.Color.greyple())
-        
-        await self.log(
-            title=f"🔊 Voice Event: {event.title()}",
-            description=f"Bot {event} voice channel",
-            color=color,
-            fields=fields,
-            guild=guild
-        )
+            embed.add_field(name='👤 Triggered By', value=f"{user.mention} ({user.display_name})", inline=True)
+        self.log(embed)
     
-    async def log_error(self, guild: discord.Guild, error_type: str, error_message: str, context: str = None):
+    def log_error(self, guild: discord.Guild, error_type: str, error_message: str, context: str = None):
         """Log errors and exceptions."""
-        fields = [
-            {'name': '❌ Error Type', 'value': error_type, 'inline': True},
-            {'name': '📝 Message', 'value': error_message[:1000], 'inline': False}
-        ]
+        if not self.enabled:
+            return
         
+        embed = self._new_embed("⚠️ Error Occurred", "An error was encountered", discord.Color.red(), guild)
+        embed.add_field(name='❌ Error Type', value=error_type, inline=True)
+        embed.add_field(name='📝 Message', value=error_message[:1000], inline=False)
         if context:
-            fields.append({'name': '🔍 Context', 'value': context[:500], 'inline': False})
-        
-        await self.log(
-            title="⚠️ Error Occurred",
-            description="An error was encountered",
-            color=discord.Color.red(),
-            fields=fields,
-            guild=guild
-        )
+            embed.add_field(name='🔍 Context', value=context[:500], inline=False)
+        self.log(embed)
     
-    async def log_session_summary(self, guild: discord.Guild, session_tracks: List[Dict], session_duration: int, listened_duration: int, reason: str):
+    def log_session_summary(self, guild: discord.Guild, session_tracks: List[Dict], session_duration: int, listened_duration: int, reason: str):
         """Log session summary to admin channel."""
-        def format_time(seconds: int) -> str:
-            hours = seconds // 3600
-            minutes = (seconds % 3600) // 60
-            secs = seconds % 60
-            if hours > 0:
-                return f"{hours}h {minutes}m {secs}s"
-            return f"{minutes}m {secs}s"
+        if not self.enabled:
+            return
         
         # Build track list
-        track_list = []
-        for i, track_data in enumerate(session_tracks[-10:], 1):
-            duration_str = format_time(track_data['duration']) if track_data['duration'] else "Unknown"
-            requester_name = track_data['requester'].display_name
-            title = track_data['title'][:40] + "..." if len(track_data['title']) > 40 else track_data['title']
-            track_list.append(f"`{i}.` {title} - {duration_str} by {requester_name}")
-        
-        tracks_text = "\n".join(track_list) if track_list else "No tracks played"
+        tracks_text = "\n".join(
+            f"`{i}.` {t['track'].title_40} - {_format_time(t['duration']) if t['duration'] else 'Unknown'} by {t['requester'].display_name}"
+            for i, t in enumerate(session_tracks[-10:], 1)
+        ) or "No tracks played"
         
         if len(session_tracks) > 10:
             tracks_text += f"\n\n*...and {len(session_tracks) - 10} more tracks*"
         
-        fields = [
-            {'name': '🕒 Session Duration', 'value': format_time(session_duration), 'inline': True},
-            {'name': '🎶 Total Listened', 'value': format_time(listened_duration), 'inline': True},
-            {'name': '📀 Tracks Played', 'value': str(len(session_tracks)), 'inline': True},
-            {'name': '❓ End Reason', 'value': reason, 'inline': False},
-            {'name': '🎵 Recent Tracks', 'value': tracks_text, 'inline': False}
-        ]
-        
-        await self.log(
-            title="📊 Session Ended",
-            description="Music session has concluded",
-            color=discord.Color.purple(),
-            fields=fields,
-            guild=guild
-        )
+        embed = self._new_embed("📊 Session Ended", "Music session has concluded", discord.Color.purple(), guild)
+        embed.add_field(name='🕒 Session Duration', value=_format_time(session_duration), inline=True)
+        embed.add_field(name='🎶 Total Listened', value=_format_time(listened_duration), inline=True)
+        embed.add_field(name='📀 Tracks Played', value=str(len(session_tracks)), inline=True)
+        embed.add_field(name='❓ End Reason', value=reason, inline=False)
+        embed.add_field(name='🎵 Recent Tracks', value=tracks_text, inline=False)
+        self.log(embed)
     
-    async def log_playlist_added(self, guild: discord.Guild, playlist_title: str, total_tracks: int, total_duration: int, user: discord.Member):
+    def log_playlist_added(self, guild: discord.Guild, playlist_title: str, total_tracks: int, total_duration: int, user: discord.Member):
         """Log when a playlist is added."""
-        def format_time(seconds: int) -> str:
-            hours = seconds // 3600
-            minutes = (seconds % 3600) // 60
-            secs = seconds % 60
-            if hours > 0:
-                return f"{hours}h {minutes}m {secs}s"
-            return f"{minutes}m {secs}s"
-        
-        duration_str = format_time(total_duration) if total_duration > 0 else "Unknown"
-        
-        fields = [
-            {'name': '📜 Playlist Name', 'value': playlist_title[:100], 'inline': False},
-            {'name': '📊 Total Tracks', 'value': str(total_tracks), 'inline': True},
-            {'name': '⏱️ Total Duration', 'value': duration_str, 'inline': True},
-            {'name': '👤 Added By', 'value': f"{user.mention} ({user.display_name})", 'inline': True}
-        ]
-        
-        await self.log(
-            title="📜 Playlist Added",
-            description="A playlist has been queued",
-            color=discord.Color.blue(),
-            fields=fields,
-            guild=guild
-        )
+        if not self.enabled:
+            return
+        
+        duration_str = _format_time(total_duration) if total_duration > 0 else "Unknown"
+        
+        embed = self._new_embed("📜 Playlist Added", "A playlist has been queued", discord.Color.blue(), guild)
+        embed.add_field(name='📜 Playlist Name', value=playlist_title[:100], inline=False)
+        embed.add_field(name='📊 Total Tracks', value=str(total_tracks), inline=True)
+        embed.add_field(name='⏱️ Total Duration', value=duration_str, inline=True)
+        embed.add_field(name='👤 Added By', value=f"{user.mention} ({user.display_name})", inline=True)
+        self.log(embed)
     
-    async def log_playlist_complete(self, guild: discord.Guild, playlist_title: str, tracks_played: int, user: discord.Member):
+    def log_playlist_complete(self, guild: discord.Guild, playlist_title: str, tracks_played: int, user: discord.Member):
         """Log when a playlist finishes playing."""
-        fields = [
-            {'name': '📜 Playlist', 'value': playlist_title[:100], 'inline': False},
-            {'name': '✅ Tracks Played', 'value': str(tracks_played), 'inline': True},
-            {'name': '👤 Added By', 'value': f"{user.mention} ({user.display_name})", 'inline': True}
-        ]
-        
-        await self.log(
-            title="✅ Playlist Completed",
-            description="Playlist has finished playing",
-            color=discord.Color.green(),
-            fields=fields,
-            guild=guild
-        )
+        if not self.enabled:
+            return
+        
+        embed = self._new_embed("✅ Playlist Completed", "Playlist has finished playing", discord.Color.green(), guild)
+        embed.add_field(name='📜 Playlist', value=playlist_title[:100], inline=False)
+        embed.add_field(name='✅ Tracks Played', value=str(tracks_played), inline=True)
+        embed.add_field(name='👤 Added By', value=f"{user.mention} ({user.display_name})", inline=True)
+        self.log(embed)
     
-    async def log_playlist_stopped(self, guild: discord.Guild, playlist_title: str, tracks_remaining: int, user: discord.Member, reason: str = None):
+    def log_playlist_stopped(self, guild: discord.Guild, playlist_title: str, tracks_remaining: int, user: discord.Member, reason: str = None):
         """Log when a playlist is manually stopped."""
-        fields = [
-            {'name': '📜 Playlist', 'value': playlist_title[:100], 'inline': False},
-            {'name': '🔢 Tracks Remaining', 'value': str(tracks_remaining), 'inline': True},
-            {'name': '👤 Stopped By', 'value': f"{user.mention} ({user.display_name})", 'inline': True}
-        ]
+        if not self.enabled:
+            return
         
+        embed = self._new_embed("⏹️ Playlist Stopped", "Playlist was manually stopped", discord.Color.orange(), guild)
+        embed.add_field(name='📜 Playlist', value=playlist_title[:100], inline=False)
+        embed.add_field(name='🔢 Tracks Remaining', value=str(tracks_remaining), inline=True)
+        embed.add_field(name='👤 Stopped By', value=f"{user.mention} ({user.display_name})", inline=True)
         if reason:
-            fields.append({'name': '📝 Reason', 'value': reason, 'inline': False})
-        
-        await self.log(
-            title="⏹️ Playlist Stopped",
-            description="Playlist was manually stopped",
-            color=discord.Color.orange(),
-            fields=fields,
-            guild=guild
-        )
+            embed.add_field(name='📝 Reason', value=reason, inline=False)
+        self.log(embed)
 
 
 class LoopMode(Enum):
@@ -305,13 +383,39 @@ class LoopMode(Enum):
     QUEUE = 2
 
 
+# Embed styling, built once at import instead of on every render
+_COLOR_PALETTE = (
+    discord.Color.blue(), discord.Color.purple(), discord.Color.magenta(),
+    discord.Color.teal(), discord.Color.green(), discord.Color.orange(),
+    discord.Color.red(), discord.Color.gold()
+)
+_QUEUE_COLOR_PALETTE = (discord.Color.blue(), discord.Color.purple(), discord.Color.teal(), discord.Color.green())
+# Indexed by LoopMode.value (OFF, TRACK, QUEUE)
+_LOOP_ICONS = ("➡️ **Off**", "🔂 **Track**", "🔁 **Queue**")
+_QUEUE_LOOP_LABELS = ("➡️ No Loop", "🔂 Loop Track", "🔁 Loop Queue")
+# /loop choice value -> (mode, confirmation)
+_LOOP_MODE_MAP = {
+    "off": (LoopMode.OFF, "➡️ Loop disabled."),
+    "track": (LoopMode.TRACK, "🔂 Looping current track."),
+    "queue": (LoopMode.QUEUE, "🔁 Looping queue."),
+}
+
+
 class VoiceChannelManager:
-    """Manages voice channel status updates to show currently playing tracks."""
+    """Manages voice channel status updates to show currently playing tracks.
+    
+    A single instance is shared by every guild so the cooldown table lives in
+    one place and concurrent channel edits are capped bot-wide.
+    """
+    
+    MAX_CONCURRENT_EDITS = 5
     
     def __init__(self):
-        self.last_update_time: Dict[int, float] = {}  # channel_id -> timestamp
+        self.last_update_time: Dict[int, float] = {}  # channel_id -> monotonic timestamp
         self.update_cooldown = 5.0  # 5 seconds between updates to avoid rate limits
         self.enabled = True
+        self.disabled_guilds: set = set()  # Guilds where we lack permission to edit status
+        self._edit_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_EDITS)
     
     def format_track_status(self, track: 'Track') -> str:
         """Format track info for channel status (500 char limit)."""
@@ -326,11 +430,14 @@ class VoiceChannelManager:
         if not self.enabled:
             return False
         
-        last_update = self.last_update_time.get(channel_id, 0)
-        return time.time() - last_update >= self.update_cooldown
+        last_update = self.last_update_time.get(channel_id)
+        return last_update is None or _now() - last_update >= self.update_cooldown
     
     async def update_channel_for_track(self, channel: discord.VoiceChannel, track: 'Track'):
         """Update channel status to show currently playing track."""
+        if channel.guild.id in self.disabled_guilds:
+            return
+        
         if not self.can_update_status(channel.id):
             print(f"[ChannelManager] Skipping status update due to cooldown: {channel.name}")
             return
@@ -340,13 +447,14 @@ class VoiceChannelManager:
             status_message = self.format_track_status(track)
             
             # Update channel status
-            await channel.edit(status=status_message)
-            self.last_update_time[channel.id] = time.time()
+            async with self._edit_semaphore:
+                await channel.edit(status=status_message)
+            self.last_update_time[channel.id] = _now()
             print(f"[ChannelManager] Updated channel status: {status_message}")
             
         except discord.Forbidden:
             print(f"[ChannelManager] No permission to update channel status: {channel.name}")
-            self.enabled = False  # Disable feature if no permissions
+            self.disabled_guilds.add(channel.guild.id)  # Disable feature for this guild only
         except discord.HTTPException as e:
             print(f"[ChannelManager] Failed to update channel status for {channel.name}: {e}")
         except Exception as e:
@@ -354,7 +462,7 @@ class VoiceChannelManager:
     
     async def clear_channel_status(self, channel: discord.VoiceChannel):
         """Clear the channel status."""
-        if not self.enabled:
+        if not self.enabled or channel.guild.id in self.disabled_guilds:
             return
         
         if not self.can_update_status(channel.id):
@@ -363,8 +471,9 @@ class VoiceChannelManager:
         
         try:
             # Clear status by setting it to None
-            await channel.edit(status=None)
-            self.last_update_time[channel.id] = time.time()
+            async with self._edit_semaphore:
+                await channel.edit(status=None)
+            self.last_update_time[channel.id] = _now()
             print(f"[ChannelManager] Cleared channel status for: {channel.name}")
             
         except discord.Forbidden:
@@ -381,14 +490,35 @@ class VoiceChannelManager:
     def cleanup_all(self):
         """Clean up all stored data."""
         self.last_update_time.clear()
+        self.disabled_guilds.clear()
+
+
+# Shared by every GuildMusicState
+_CHANNEL_MANAGER = VoiceChannelManager()
+
+# IDs of channels currently hosting a now playing panel, kept in sync by
+# GuildMusicState.now_playing_message so on_message can reject other channels cheaply
+_PANEL_CHANNELS: set = set()
 
 
 class Track:
+    # Slots keep per-track memory down for long queues; add new attributes here
+    __slots__ = (
+        'title', 'url', 'stream_url', 'duration', 'duration_str', 'thumbnail', 'webpage_url',
+        'uploader', 'requester', 'local_file', 'temp_dir', 'is_downloaded',
+        'cache_id', '_title_100', '_title_50', '_title_45', '_title_40', '_title_35',
+        '_uploader_50'
+    )
+    
+    # Shared downloader used to remove this track's temp files
+    _ytdl_source: YTDLSource = ytdl_source
+    
     def __init__(self, info: Dict[str, Any], requester: discord.Member):
         self.title = info['title']
         self.url = info['url']
         self.stream_url = info['url']
         self.duration = info['duration']
+        self.duration_str = YTDLSource.format_duration(self.duration)  # Formatted once; read by every embed
         self.thumbnail = info.get('thumbnail')
         self.webpage_url = info['webpage_url']
         self.uploader = info.get('uploader', 'Unknown')
@@ -398,6 +528,57 @@ class Track:
         self.local_file = info.get('local_file')  # Path to downloaded file
         self.temp_dir = info.get('temp_dir')  # Temp directory for cleanup
         self.is_downloaded = info.get('is_downloaded', False)
+        self.cache_id = info.get('cache_id')  # Disk cache entry this track holds, if any
+        
+        # Truncated display strings, filled on first use
+        self._title_100: Optional[str] = None
+        self._title_50: Optional[str] = None
+        self._title_45: Optional[str] = None
+        self._title_40: Optional[str] = None
+        self._title_35: Optional[str] = None
+        self._uploader_50: Optional[str] = None
+    
+    @property
+    def title_100(self) -> str:
+        """Title clipped to 100 characters for admin log fields."""
+        if self._title_100 is None:
+            self._title_100 = self.title[:100]
+        return self._title_100
+    
+    @property
+    def title_50(self) -> str:
+        """Title shortened to 50 characters with an ellipsis for queue confirmations."""
+        if self._title_50 is None:
+            self._title_50 = _truncate(self.title, 50)
+        return self._title_50
+    
+    @property
+    def title_40(self) -> str:
+        """Title shortened to 40 characters with an ellipsis for track lists."""
+        if self._title_40 is None:
+            self._title_40 = _truncate(self.title, 40)
+        return self._title_40
+    
+    @property
+    def title_45(self) -> str:
+        """Title shortened to 45 characters with an ellipsis for queue listings."""
+        if self._title_45 is None:
+            self._title_45 = _truncate(self.title, 45)
+        return self._title_45
+    
+    @property
+    def title_35(self) -> str:
+        """Title shortened to 35 characters with an ellipsis for the Up Next preview."""
+        if self._title_35 is None:
+            self._title_35 = _truncate(self.title, 35)
+        return self._title_35
+    
+    @property
+    def uploader_50(self) -> str:
+        """Uploader clipped to 50 characters for admin log fields."""
+        if self._uploader_50 is None:
+            self._uploader_50 = self.uploader[:50]
+        return self._uploader_50
     
     def get_audio_source(self) -> str:
         """Get the audio source path - local file if downloaded, stream URL otherwise."""
@@ -407,29 +588,123 @@ class Track:
     
     def cleanup(self):
         """Clean up downloaded files if this track was downloaded."""
-        if self.is_downloaded and hasattr(self, '_ytdl_source'):
+        if self.is_downloaded:
             self._ytdl_source.cleanup_track_file({
                 'is_downloaded': self.is_downloaded,
                 'temp_dir': self.temp_dir
             })
+        self.release_cache()
+    
+    def release_cache(self):
+        """Let the disk cache evict this track's file once no other track holds it."""
+        cache_id, self.cache_id = self.cache_id, None
+        if cache_id is not None:
+            self._ytdl_source.release_cached(cache_id)
+    
+    def __del__(self):
+        # Safety net for tracks dropped without release_cache(); only enqueue the id,
+        # since the collecting thread may already hold the cache lock
+        cache_id = getattr(self, 'cache_id', None)
+        if cache_id is not None:
+            self._ytdl_source.defer_release(cache_id)
     
     def __str__(self):
         return f"**{self.title}** by {self.uploader}"
-    
-    @property
-    def duration_str(self) -> str:
-        return YTDLSource.format_duration(self.duration)
+
+
+class TrackQueue(deque):
+    """Deque of tracks that keeps a running total of their durations.
+    
+    Embeds show the remaining queue time on every refresh; keeping the sum
+    up to date on each mutation makes that O(1) instead of a walk over the
+    whole queue.
+    """
+    
+    __slots__ = ('total_duration',)
+    
+    def __init__(self, tracks=()):
+        super().__init__(tracks)
+        self.total_duration = sum(t.duration or 0 for t in self)
+    
+    def append(self, track: Track):
+        super().append(track)
+        self.total_duration += track.duration or 0
+    
+    def appendleft(self, track: Track):
+        super().appendleft(track)
+        self.total_duration += track.duration or 0
+    
+    def insert(self, index: int, track: Track):
+        super().insert(index, track)
+        self.total_duration += track.duration or 0
+    
+    def extend(self, tracks):
+        for track in tracks:
+            self.append(track)
+    
+    def extendleft(self, tracks):
+        for track in tracks:
+            self.appendleft(track)
+    
+    def __iadd__(self, tracks):
+        self.extend(tracks)
+        return self
+    
+    def pop(self) -> Track:
+        track = super().pop()
+        self.total_duration -= track.duration or 0
+        return track
+    
+    def popleft(self) -> Track:
+        track = super().popleft()
+        self.total_duration -= track.duration or 0
+        return track
+    
+    def remove(self, track: Track):
+        super().remove(track)
+        self.total_duration -= track.duration or 0
+    
+    def __delitem__(self, index: int):
+        track = self[index]
+        super().__delitem__(index)
+        self.total_duration -= track.duration or 0
+    
+    def __setitem__(self, index: int, track: Track):
+        old = self[index]
+        super().__setitem__(index, track)
+        self.total_duration += (track.duration or 0) - (old.duration or 0)
+    
+    def clear(self):
+        super().clear()
+        self.total_duration = 0
 
 
 class GuildMusicState:
+    # Slots cover every attribute set on the state; add new ones here
+    __slots__ = (
+        'bot', 'queue', 'current', 'previous', 'history', 'voice_client',
+        '_now_playing_message', 'text_channel', 'loop_mode', 'is_playing', 'volume',
+        'current_position', 'total_tracks', 'lock', 'session_start_time',
+        'session_tracks', '_listened_total', 'session_active', 'skip_votes',
+        '_listener_cache',
+        'skip_threshold', 'disconnect_reason', 'idle_timeout', 'idle_task', 'alone_task',
+        'channel_manager', 'channel_name_updates_enabled', '_status_task',
+        '_pending_status_track', 'status_update_delay', 'last_panel_move_time',
+        'panel_move_cooldown', 'embed_updates_active', '_advancing', 'queue_drained',
+        'track_start_time', '_embed_dirty', '_embed_refresh_task',
+        'embed_refresh_delay', '_last_embed_signature', '_move_throttle_handle',
+        '_move_pending', '_embed_skeleton', '_now_template', '_control_view', 'current_playlist',
+        'playlist_track_index', 'playlist_finished'
+    )
+    
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.queue: List[Track] = []
+        self.queue: TrackQueue = TrackQueue()
         self.current: Optional[Track] = None
         self.previous: Optional[Track] = None
-        self.history: List[Track] = []
+        self.history: Deque[Track] = deque(maxlen=HISTORY_LIMIT)  # Oldest entries drop off automatically
         self.voice_client: Optional[discord.VoiceClient] = None
-        self.now_playing_message: Optional[discord.Message] = None
+        self._now_playing_message: Optional[discord.Message] = None
         self.text_channel: Optional[discord.TextChannel] = None
         
         self.loop_mode = LoopMode.OFF
@@ -442,38 +717,72 @@ class GuildMusicState:
         # Session tracking for reports
         self.session_start_time: Optional[float] = None
         self.session_tracks: List[Dict] = []  # List of {track, requester, started_at, duration}
+        self._listened_total = 0  # Running sum of session_tracks durations
         self.session_active = False
         
         self.skip_votes: set = set()
         self.skip_threshold = 0.5
+        self._listener_cache: Optional[Tuple[int, int]] = None  # (voice channel id, human member count)
         self.disconnect_reason: Optional[str] = None
         
-        self.idle_timeout = int(os.getenv('QUEUE_TIMEOUT', '300'))
-        self.idle_task: Optional[asyncio.Task] = None
+        self.idle_timeout = QUEUE_TIMEOUT
+        # TimerHandle while waiting out the timeout, then the disconnect Task; both cancel()
+        self.idle_task: Optional[Union[asyncio.TimerHandle, asyncio.Task]] = None
+        self.alone_task: Optional[asyncio.Task] = None  # Pending "alone in channel" disconnect
         
         # Voice channel name management
-        self.channel_manager = VoiceChannelManager()
-        self.channel_name_updates_enabled = os.getenv('CHANNEL_NAME_UPDATES', 'true').lower() == 'true'
+        self.channel_manager = _CHANNEL_MANAGER
+        self.channel_name_updates_enabled = CHANNEL_NAME_UPDATES
+        self._status_task: Optional[asyncio.Task] = None  # Debounced channel status update
+        self._pending_status_track: Optional[Track] = None
+        self.status_update_delay = 2.0  # Seconds to wait so rapid skips coalesce into one update
         
         # Control panel management
-        self.last_panel_move_time = 0.0  # Track when we last moved the panel
+        self.last_panel_move_time = float('-inf')  # Monotonic time we last moved the panel
         self.panel_move_cooldown = 3.0  # 3 seconds cooldown between panel moves
+        self._move_throttle_handle: Optional[asyncio.TimerHandle] = None  # Pending trailing-edge move
+        self._move_pending = False
+        self._control_view: Optional['ControlButtons'] = None  # Reused for every panel message
         
         # Real-time embed updates
-        self.embed_update_task: Optional[asyncio.Task] = None
-        self.embed_update_interval = 5.0  # Update embed every 5 seconds
+        self.embed_updates_active = False  # Refreshed by the cog-wide embed ticker while set
+        self._advancing = False  # Set while _play_next is picking and starting a track
+        self.queue_drained = asyncio.Event()  # Wakes the playlist fetcher when it may add more
         self.track_start_time: Optional[float] = None  # Track when current song started
         
+        # Coalesced embed refreshes - queue changes mark the embed dirty and
+        # a single task applies them, so a burst of changes costs one edit
+        self._embed_dirty = False
+        self._embed_refresh_task: Optional[asyncio.Task] = None
+        self.embed_refresh_delay = 0.5  # Seconds to wait for more changes before editing
+        self._last_embed_signature: Optional[tuple] = None  # Inputs of the last embed we pushed
+        self._embed_skeleton: Optional[Tuple[tuple, Dict[str, Any]]] = None  # (key, parts that only change per track)
+        self._now_template: Optional[Tuple[tuple, discord.Embed]] = None  # (key, /now embed with per-track fields)
+        
         # Playlist tracking
-        self.current_playlist: Optional[Dict] = None  # {'title': str, 'total': int, 'added_by': Member, 'added_at': float, 'duration': int}
+        self.current_playlist: Optional[Dict] = None  # {'title': str, 'total': int, 'added_by': Member, 'added_at': monotonic float, 'duration': int}
         self.playlist_track_index = 0  # Current track index in playlist
         self.playlist_finished = False  # Flag for playlist completion logging
     
-    async def add_track(self, track: Track):
-        async with self.lock:
-            self.queue.append(track)
+    # Single deque operations never yield to the event loop, so they don't
+    # need self.lock; it only guards the compound update in next_track()
+    @property
+    def now_playing_message(self) -> Optional[discord.Message]:
+        """The message carrying this guild's control panel, if one is shown."""
+        return self._now_playing_message
+    
+    @now_playing_message.setter
+    def now_playing_message(self, message: Optional[discord.Message]):
+        if self._now_playing_message is not None:
+            _PANEL_CHANNELS.discard(self._now_playing_message.channel.id)
+        if message is not None:
+            _PANEL_CHANNELS.add(message.channel.id)
+        self._now_playing_message = message
+    
+    def add_track(self, track: Track):
+        self.queue.append(track)
         # Update embed when track is added
-        await self.update_embed_now()
+        self.request_embed_update()
     
     async def next_track(self) -> Optional[Track]:
         async with self.lock:
@@ -484,11 +793,9 @@ class GuildMusicState:
             if self.current and self.loop_mode != LoopMode.TRACK:
                 self.previous = self.current
                 self.history.append(self.current)
-                if len(self.history) > 50:
-                    self.history.pop(0)
             
             if len(self.queue) > 0:
-                self.current = self.queue.pop(0)
+                self.current = self.queue.popleft()
                 self.current_position += 1
                 self.skip_votes.clear()
                 
@@ -514,62 +821,66 @@ class GuildMusicState:
         if self.voice_client and self.voice_client.is_playing():
             self.voice_client.stop()
     
-    async def clear_queue(self):
-        async with self.lock:
-            self.queue.clear()
+    def clear_queue(self):
+        # Cleared tracks never play, so hand their cached files back now
+        for track in self.queue:
+            track.release_cache()
+        self.queue.clear()
+        self.queue_drained.set()
         # Update embed when queue changes
-        await self.update_embed_now()
+        self.request_embed_update()
     
-    async def shuffle_queue(self):
-        async with self.lock:
-            random.shuffle(self.queue)
+    def shuffle_queue(self):
+        # Shuffle a list copy; random.shuffle on a deque is O(n^2) indexing
+        tracks = list(self.queue)
+        random.shuffle(tracks)
+        # Refill in place so callers holding a reference to the queue stay valid
+        self.queue.clear()
+        self.queue.extend(tracks)
+        self.request_embed_update()
     
     def start_session(self):
         """Start a new listening session."""
-        import time
-        self.session_start_time = time.time()
+        self.session_start_time = _now()
         self.session_tracks = []
+        self._listened_total = 0
         self.session_active = True
         self.current_position = 0
         print(f"[Session] Started new session")
     
     def record_track_play(self, track: Track):
         """Record that a track started playing."""
-        import time
         if not self.session_active:
             self.start_session()
         
         track_data = {
             'track': track,
             'requester': track.requester,
-            'started_at': time.time(),
+            'started_at': _now(),
             'duration': track.duration if track.duration else 0,
             'title': track.title,
             'uploader': track.uploader,
             'webpage_url': track.webpage_url
         }
         self.session_tracks.append(track_data)
+        self._listened_total += track_data['duration']
         print(f"[Session] Recorded track: {track.title}")
     
     def get_session_duration(self) -> int:
         """Get total session duration in seconds."""
-        import time
         if not self.session_start_time:
             return 0
-        return int(time.time() - self.session_start_time)
+        return int(_now() - self.session_start_time)
     
     def get_total_listened_duration(self) -> int:
         """Get total duration of all played tracks."""
-        return sum(t['duration'] for t in self.session_tracks if t['duration'])
+        return self._listened_total
     
     async def generate_session_report(self, music_cog) -> Optional[discord.Embed]:
         """Generate a session report embed."""
         if not self.session_tracks:
             return None
         
-        import time
-        from datetime import datetime
-        
         # Calculate stats
         total_tracks = len(self.session_tracks)
         session_duration = self.get_session_duration()
@@ -603,21 +914,17 @@ class GuildMusicState:
         )
         
         # List tracks (limit to 10 most recent)
-        tracks_to_show = self.session_tracks[-10:] if len(self.session_tracks) > 10 else self.session_tracks
-        
-        track_list = []
-        for i, track_data in enumerate(tracks_to_show, 1):
-            duration_str = self.format_time(track_data['duration']) if track_data['duration'] else "Unknown"
-            requester_name = track_data['requester'].display_name
-            title = track_data['title'][:40] + "..." if len(track_data['title']) > 40 else track_data['title']
-            track_list.append(f"`{i}.` **{title}**\n⏱️ {duration_str} • 👤 {requester_name}")
+        tracks_text = "\n".join(
+            f"`{i}.` **{t['track'].title_40}**\n⏱️ {_format_time(t['duration']) if t['duration'] else 'Unknown'} • 👤 {t['requester'].display_name}"
+            for i, t in enumerate(self.session_tracks[-10:], 1)
+        )
         
         if len(self.session_tracks) > 10:
-            track_list.append(f"\n*...and {len(self.session_tracks) - 10} more tracks*")
+            tracks_text += f"\n\n*...and {len(self.session_tracks) - 10} more tracks*"
         
         embed.add_field(
             name="🎵 Recently Played",
-            value="\n".join(track_list) if track_list else "No tracks",
+            value=tracks_text or "No tracks",
             inline=False
         )
         
@@ -638,8 +945,8 @@ class GuildMusicState:
         
         try:
             # Log session summary to admin channel
-            if hasattr(music_cog, 'admin_logger') and self.voice_client:
-                await music_cog.admin_logger.log_session_summary(
+            if self.voice_client:
+                music_cog.admin_logger.log_session_summary(
                     self.voice_client.guild,
                     self.session_tracks,
                     self.get_session_duration(),
@@ -666,8 +973,54 @@ class GuildMusicState:
         except Exception as e:
             print(f"Error updating channel name: {e}")
     
+    def apply_volume(self, source: discord.AudioSource) -> discord.AudioSource:
+        """Wrap `source` for the current volume in a fresh transformer."""
+        # At 100% the transformer would only multiply every frame by 1.0
+        if self.volume == 1.0:
+            return source
+        # A new wrapper per track: the previous player thread still cleans up its
+        # own transformer's .original after playback, so sharing one would let it
+        # kill the next track's FFmpeg process
+        return discord.PCMVolumeTransformer(source, volume=self.volume)
+    
+    def human_listener_count(self, refresh: bool = False) -> int:
+        """Non-bot members in the bot's voice channel, recounted only on voice state changes."""
+        channel = self.voice_client.channel if self.voice_client else None
+        if channel is None:
+            return 0
+        cached = self._listener_cache
+        if refresh or cached is None or cached[0] != channel.id:
+            cached = (channel.id, sum(1 for m in channel.members if not m.bot))
+            self._listener_cache = cached
+        return cached[1]
+    
+    def schedule_channel_status(self, track: Track):
+        """Show `track` in the channel status soon, without holding up playback."""
+        if not self.channel_name_updates_enabled:
+            return
+        self._pending_status_track = track
+        if self._status_task is None or self._status_task.done():
+            self._status_task = asyncio.create_task(self._channel_status_loop())
+    
+    async def _channel_status_loop(self):
+        """Background task that applies the latest requested channel status, then exits."""
+        try:
+            while self._pending_status_track is not None:
+                await asyncio.sleep(self.status_update_delay)
+                track, self._pending_status_track = self._pending_status_track, None
+                if track is self.current:
+                    await self.update_channel_name_for_track(track)
+        except asyncio.CancelledError:
+            pass
+    
     async def clear_channel_status(self):
         """Clear voice channel status."""
+        # A status update still waiting to fire would overwrite the clear
+        self._pending_status_track = None
+        if self._status_task and not self._status_task.done():
+            self._status_task.cancel()
+        self._status_task = None
+        
         if not self.channel_name_updates_enabled or not self.voice_client:
             return
         
@@ -680,16 +1033,13 @@ class GuildMusicState:
     
     async def cleanup_channel_manager(self):
         """Clean up channel manager data."""
+        # The manager is shared across guilds, so only drop this guild's channel
         if self.voice_client and self.voice_client.channel:
             self.channel_manager.cleanup_channel(self.voice_client.channel.id)
-        else:
-            # Clean up all if we don't have a specific channel
-            self.channel_manager.cleanup_all()
     
     def can_move_panel(self) -> bool:
         """Check if enough time has passed to move the control panel."""
-        import time
-        current_time = time.time()
+        current_time = _now()
         if current_time - self.last_panel_move_time >= self.panel_move_cooldown:
             self.last_panel_move_time = current_time
             return True
@@ -699,8 +1049,7 @@ class GuildMusicState:
         """Get elapsed time in seconds since track started."""
         if not self.track_start_time or not self.current:
             return 0
-        import time
-        elapsed = int(time.time() - self.track_start_time)
+        elapsed = int(_now() - self.track_start_time)
         # Ensure we don't exceed track duration
         if self.current.duration:
             return min(elapsed, self.current.duration)
@@ -713,33 +1062,55 @@ class GuildMusicState:
         elapsed = self.get_elapsed_time()
         return max(0, self.current.duration - elapsed)
     
-    def format_time(self, seconds: int) -> str:
+    @staticmethod
+    def format_time(seconds: int) -> str:
         """Format seconds to MM:SS or HH:MM:SS."""
-        if seconds < 0:
-            seconds = 0
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        secs = seconds % 60
-        if hours > 0:
-            return f"{hours}:{minutes:02d}:{secs:02d}"
-        return f"{minutes}:{secs:02d}"
-    
-    def create_progress_bar(self, percentage: float, length: int = 20) -> str:
+        return _format_clock(int(seconds))
+    
+    @staticmethod
+    def create_progress_bar(percentage: float, length: int = 20) -> str:
         """Create a progress bar visualization."""
-        filled = int(length * percentage / 100)
-        bar = '█' * filled + '░' * (length - filled)
-        return f"`[{bar}]`"
+        filled = min(max(int(length * percentage / 100), 0), length)
+        if length == 20:
+            return _PROGRESS_BARS_20[filled]
+        return _progress_bar(filled, length)
+    
+    def _embed_signature(self) -> tuple:
+        """Everything the now playing embed renders, used to skip no-op edits."""
+        if self.voice_client:
+            status = 'paused' if self.voice_client.is_paused() else self.voice_client.is_playing()
+        else:
+            status = None
+        return (
+            self.now_playing_message.id,
+            id(self.current),
+            self.get_elapsed_time(),
+            len(self.queue),
+            self.queue.total_duration,
+            id(self.queue[0]) if self.queue else None,
+            self.loop_mode,
+            self.volume,
+            status,
+            self.current_position,
+            self.playlist_track_index,
+        )
     
     async def update_embed_now(self):
         """Force an immediate embed update."""
         if not self.now_playing_message or not self.current:
             return
         
+        # Nothing visible changed since the last edit - skip the round-trip
+        signature = self._embed_signature()
+        if signature == self._last_embed_signature:
+            return
+        
         try:
             # Create updated embed with current state
             embed = await self._create_now_playing_embed()
             if embed:
                 await self.now_playing_message.edit(embed=embed)
+                self._last_embed_signature = signature
         except (discord.NotFound, discord.Forbidden, discord.HTTPException) as e:
             print(f"Could not update embed: {e}")
         except Exception as e:
@@ -750,19 +1121,14 @@ class GuildMusicState:
         if not self.current:
             return None
         
-        # Color scheme
-        colors = [
-            discord.Color.blue(), discord.Color.purple(), discord.Color.magenta(), 
-            discord.Color.teal(), discord.Color.green(), discord.Color.orange(),
-            discord.Color.red(), discord.Color.gold()
-        ]
-        color = colors[self.current_position % len(colors)]
+        skeleton = self._get_embed_skeleton()
+        queue_count = len(self.queue)  # Read once so every field agrees
         
         # Create embed
         embed = discord.Embed(
             title="🎵 Now Playing",
-            description=f"**[{self.current.title}]({self.current.webpage_url})**\n\n🎶 *Enjoy the music!*",
-            color=color
+            description=skeleton['description'],
+            color=skeleton['color']
         )
         
         # Progress information
@@ -774,17 +1140,16 @@ class GuildMusicState:
             
             elapsed_str = self.format_time(elapsed)
             remaining_str = self.format_time(remaining)
-            total_str = self.current.duration_str
+            total_str = skeleton['total_str']
             
             progress_text = f"{progress_bar}\n`{elapsed_str}` / `{total_str}` • `-{remaining_str}` remaining"
             embed.add_field(name="⏱️ Progress", value=progress_text, inline=False)
         
         # Track info row
-        embed.add_field(name="📺 Channel", value=f"`{self.current.uploader}`", inline=True)
-        embed.add_field(name="👤 Requested by", value=self.current.requester.mention, inline=True)
+        embed.add_field(name="📺 Channel", value=skeleton['channel'], inline=True)
+        embed.add_field(name="👤 Requested by", value=skeleton['requester'], inline=True)
         
         # Playback status row - show playlist position if in playlist, otherwise session position
-        queue_count = len(self.queue)
         if self.current_playlist:
             # Show playlist position: "Track 5 of 300 • 295 remaining"
             position_display = f"**Track {self.playlist_track_index} of {self.current_playlist['total']}** • `{queue_count}` remaining"
@@ -798,12 +1163,7 @@ class GuildMusicState:
         embed.add_field(name="🔊 Volume", value=volume_display, inline=True)
         
         # Loop mode indicator
-        loop_icons = {
-            LoopMode.OFF: "➡️ **Off**",
-            LoopMode.TRACK: "🔂 **Track**",
-            LoopMode.QUEUE: "🔁 **Queue**"
-        }
-        embed.add_field(name="🔁 Loop Mode", value=loop_icons[self.loop_mode], inline=True)
+        embed.add_field(name="🔁 Loop Mode", value=_LOOP_ICONS[self.loop_mode.value], inline=True)
         
         # Playback status
         if self.voice_client:
@@ -816,81 +1176,149 @@ class GuildMusicState:
             embed.add_field(name="🎵 Status", value=status, inline=True)
         
         # Queue preview
-        if len(self.queue) > 0:
+        if queue_count > 0:
             next_track = self.queue[0]
-            next_title = next_track.title[:35] + "..." if len(next_track.title) > 35 else next_track.title
+            next_title = next_track.title_35
             next_info = f"**{next_title}**\n⏱️ `{next_track.duration_str}` • 👤 {next_track.requester.display_name}"
             embed.add_field(name="⏭️ Up Next", value=next_info, inline=False)
         else:
             embed.add_field(name="⏭️ Up Next", value="*Queue is empty - add more songs!*", inline=False)
         
         # Thumbnail
-        if self.current.thumbnail:
-            embed.set_thumbnail(url=self.current.thumbnail)
+        if skeleton['thumbnail']:
+            embed.set_thumbnail(url=skeleton['thumbnail'])
         
         # Footer with queue info - show playlist total when playlist is active
-        queue_duration = sum(t.duration for t in self.queue if t.duration)
+        queue_duration = self.queue.total_duration
         queue_time_str = self.format_time(queue_duration) if queue_duration > 0 else "0:00"
-        playback_mode = "📁 Downloaded" if self.current.is_downloaded else "🌐 Streaming"
+        playback_mode = skeleton['playback_mode']
         
         if self.current_playlist:
             # For playlists: Show total playlist count, not queue count
             footer_text = f"🎶 Playlist Loaded — {self.current_playlist['total']} Tracks • {queue_time_str} remaining"
         else:
             # For regular playback: Show queue count
-            footer_text = f"{playback_mode} • {len(self.queue)} in queue • {queue_time_str} remaining"
+            footer_text = f"{playback_mode} • {queue_count} in queue • {queue_time_str} remaining"
         
-        embed.set_footer(text=footer_text, icon_url=self.current.requester.display_avatar.url)
+        embed.set_footer(text=footer_text, icon_url=skeleton['footer_icon'])
         
         return embed
     
+    def _get_embed_skeleton(self) -> Dict[str, Any]:
+        """Return the now playing embed parts that only change when the track does."""
+        # Keyed on the Track object itself (not id()) so a recycled id can't match
+        key = (self.current, self.current_position)
+        if self._embed_skeleton is None or self._embed_skeleton[0] != key:
+            track = self.current
+            self._embed_skeleton = (key, {
+                'color': _COLOR_PALETTE[self.current_position % len(_COLOR_PALETTE)],
+                'description': f"**[{track.title}]({track.webpage_url})**\n\n🎶 *Enjoy the music!*",
+                'total_str': track.duration_str,
+                'channel': f"`{track.uploader}`",
+                'requester': track.requester.mention,
+                'thumbnail': track.thumbnail,
+                'playback_mode': "📁 Downloaded" if track.is_downloaded else "🌐 Streaming",
+                'footer_icon': track.requester.display_avatar.url,
+            })
+        return self._embed_skeleton[1]
+    
+    def get_now_template(self) -> discord.Embed:
+        """Return the /now embed holding only the fields that change per track; copy before adding to it."""
+        key = (self.current, self.current_position)
+        if self._now_template is None or self._now_template[0] != key:
+            track = self.current
+            embed = discord.Embed(
+                title="🎵 Currently Playing",
+                description=f"**[{track.title}]({track.webpage_url})**\n\n🎶 *Now streaming for your enjoyment*",
+                color=_COLOR_PALETTE[self.current_position % len(_COLOR_PALETTE)]
+            )
+            embed.add_field(name="📺 Channel", value=f"`{track.uploader}`", inline=True)
+            embed.add_field(name="⏱️ Duration", value=f"`{track.duration_str}`", inline=True)
+            embed.add_field(name="👤 Requested by", value=track.requester.mention, inline=True)
+            if track.thumbnail:
+                embed.set_thumbnail(url=track.thumbnail)
+            self._now_template = (key, embed)
+        return self._now_template[1]
+    
     async def start_embed_updates(self, music_cog=None):
-        """Start the periodic embed update task."""
+        """Opt this guild in to the cog's periodic embed refresh."""
         # Check if feature is enabled
-        if music_cog and hasattr(music_cog, 'realtime_embed_updates'):
-            if not music_cog.realtime_embed_updates:
-                return  # Feature disabled
+        if music_cog and not music_cog.realtime_embed_updates:
+            return  # Feature disabled
         
-        if self.embed_update_task and not self.embed_update_task.done():
-            return  # Already running
-        
-        self.embed_update_task = asyncio.create_task(self._update_embed_loop())
+        self.embed_updates_active = True
     
     async def stop_embed_updates(self):
-        """Stop the periodic embed update task."""
-        if self.embed_update_task:
-            self.embed_update_task.cancel()
-            try:
-                await self.embed_update_task
-            except asyncio.CancelledError:
-                pass
-            self.embed_update_task = None
-    
-    async def _update_embed_loop(self):
-        """Background task that periodically updates the embed."""
+        """Stop periodic and pending embed updates for this guild."""
+        self.embed_updates_active = False
+        
+        if self._embed_refresh_task:
+            self._embed_refresh_task.cancel()
+            self._embed_refresh_task = None
+        self._embed_dirty = False
+        
+        if self._move_throttle_handle:
+            self._move_throttle_handle.cancel()
+            self._move_throttle_handle = None
+        self._move_pending = False
+    
+    def request_embed_update(self):
+        """Schedule an embed refresh; requests arriving close together share one edit."""
+        self._embed_dirty = True
+        if self._embed_refresh_task is None or self._embed_refresh_task.done():
+            self._embed_refresh_task = asyncio.create_task(self._embed_refresh_loop())
+    
+    async def _embed_refresh_loop(self):
+        """Background task that applies coalesced embed refresh requests, then exits."""
         try:
-            while self.is_playing and self.current:
-                await asyncio.sleep(self.embed_update_interval)
-                if self.is_playing and self.current:
-                    await self.update_embed_now()
+            while self._embed_dirty:
+                await asyncio.sleep(self.embed_refresh_delay)
+                # Clear after the delay so changes made while waiting are included
+                self._embed_dirty = False
+                await self.update_embed_now()
         except asyncio.CancelledError:
             pass
         except Exception as e:
-            print(f"Error in embed update loop: {e}")
+            print(f"Error in embed refresh loop: {e}")
+    
+    def schedule_panel_move(self, music_cog):
+        """Request a panel move; a burst of requests is served by one move after the cooldown."""
+        self._move_pending = True
+        if self._move_throttle_handle is None:
+            loop = asyncio.get_running_loop()
+            self._move_throttle_handle = loop.call_later(self.panel_move_cooldown, self._fire_panel_move, music_cog)
+    
+    def _fire_panel_move(self, music_cog):
+        """Timer callback that starts the pending panel move, if it is still wanted."""
+        self._move_throttle_handle = None
+        if not self._move_pending:
+            return
+        self._move_pending = False
+        if self.is_playing and self.now_playing_message:
+            asyncio.create_task(self.move_panel_to_bottom(music_cog))
+    
+    def get_control_view(self, music_cog) -> 'ControlButtons':
+        """Return this guild's control panel view, creating it on first use."""
+        # The buttons carry no per-message state, so one view serves every panel we post
+        if self._control_view is None:
+            self._control_view = ControlButtons(music_cog, self.voice_client.guild.id)
+        return self._control_view
     
     async def move_panel_to_bottom(self, music_cog):
         """Move the control panel to the bottom of the channel."""
         if not self.now_playing_message or not self.current or not self.is_playing:
             return
         
+        # Already the newest message in the channel - refresh in place instead
+        # of paying for a delete + send
+        if self.now_playing_message.channel.last_message_id == self.now_playing_message.id:
+            await self.update_embed_now()
+            return
+        
         if not self.can_move_panel():
             return  # Skip if in cooldown
         
         try:
-            # Get the current embed
-            if not self.now_playing_message.embeds:
-                return
-            
             # Create fresh embed with current state
             embed = await self._create_now_playing_embed()
             if not embed:
@@ -901,8 +1329,8 @@ class GuildMusicState:
             # Delete the old message
             await self.now_playing_message.delete()
             
-            # Recreate the control buttons view
-            view = ControlButtons(music_cog, self.voice_client.guild.id)
+            # Reuse the control buttons view
+            view = self.get_control_view(music_cog)
             
             # Send new message at the bottom
             new_message = await channel.send(embed=embed, view=view)
@@ -916,20 +1344,26 @@ class GuildMusicState:
     def reset_idle_timer(self):
         if self.idle_task:
             self.idle_task.cancel()
-        self.idle_task = asyncio.create_task(self._idle_disconnect())
+        # A plain timer callback; no task exists unless the timeout actually fires
+        loop = asyncio.get_running_loop()
+        self.idle_task = loop.call_later(self.idle_timeout, self._idle_timeout_fired)
+    
+    def _idle_timeout_fired(self):
+        """Timer callback: start the disconnect only if we are still idle."""
+        self.idle_task = None
+        if self.voice_client and not self.voice_client.is_playing():
+            self.idle_task = asyncio.create_task(self._idle_disconnect())
     
     async def _idle_disconnect(self):
         try:
-            await asyncio.sleep(self.idle_timeout)
             if self.voice_client and not self.voice_client.is_playing():
                 # Clear channel status before disconnecting
                 await self.clear_channel_status()
                 
                 # Send session report (pass bot reference)
-                if hasattr(self, 'bot'):
-                    music_cog = self.bot.get_cog('Music')
-                    if music_cog:
-                        await self.send_session_report(music_cog, "Music session ended - Auto-disconnect due to inactivity")
+                music_cog = self.bot.get_cog('Music')
+                if music_cog:
+                    await self.send_session_report(music_cog, "Music session ended - Auto-disconnect due to inactivity")
                 
                 await self.voice_client.disconnect()
                 self.voice_client = None
@@ -947,8 +1381,7 @@ class QueuePaginator(discord.ui.View):
     
     def get_page_content(self, state: GuildMusicState) -> Tuple[discord.Embed, int]:
         # Use gradient colors for visual appeal
-        colors = [discord.Color.blue(), discord.Color.purple(), discord.Color.teal(), discord.Color.green()]
-        color = colors[self.page % len(colors)]
+        color = _QUEUE_COLOR_PALETTE[self.page % len(_QUEUE_COLOR_PALETTE)]
         
         embed = discord.Embed(
             title="📜 Music Queue",
@@ -971,13 +1404,12 @@ class QueuePaginator(discord.ui.View):
         end_idx = min(start_idx + self.items_per_page, total_tracks)
         
         if total_tracks > 0:
-            queue_text = ""
-            for i in range(start_idx, end_idx):
-                track = state.queue[i]
+            parts = []
+            for i, track in enumerate(itertools.islice(state.queue, start_idx, end_idx), start_idx):
                 # Better formatting with proper truncation
-                title = track.title[:45] + "..." if len(track.title) > 45 else track.title
-                queue_text += f"`{i+1:2d}.` **{title}**\n"
-                queue_text += f"     ⏱️ `{track.duration_str}` • 👤 {track.requester.display_name}\n\n"
+                title = track.title_45
+                parts.append(f"`{i+1:2d}.` **{title}**\n     ⏱️ `{track.duration_str}` • 👤 {track.requester.display_name}\n\n")
+            queue_text = "".join(parts)
             
             embed.add_field(
                 name=f"⏭️ Up Next • Page {self.page + 1}/{total_pages}",
@@ -999,17 +1431,11 @@ class QueuePaginator(discord.ui.View):
             )
         
         # Enhanced footer with more info
-        loop_icons = {
-            LoopMode.OFF: "➡️ No Loop",
-            LoopMode.TRACK: "🔂 Loop Track",
-            LoopMode.QUEUE: "🔁 Loop Queue"
-        }
-        
-        queue_duration = sum(t.duration for t in state.queue if t.duration)
+        queue_duration = state.queue.total_duration
         queue_time = YTDLSource.format_duration(queue_duration) if queue_duration > 0 else "0:00"
         
         embed.set_footer(
-            text=f"{loop_icons[state.loop_mode]} • {total_tracks} tracks • {queue_time} remaining"
+            text=f"{_QUEUE_LOOP_LABELS[state.loop_mode.value]} • {total_tracks} tracks • {queue_time} remaining"
         )
         
         return embed, total_pages
@@ -1116,7 +1542,7 @@ class ControlButtons(discord.ui.View):
             # Update embed immediately
             await state.update_embed_now()
             # Log to admin channel
-            await self.cog.admin_logger.log_playback_action(
+            self.cog.admin_logger.log_playback_action(
                 interaction.guild, "Resume", interaction.user
             )
         elif state.voice_client.is_playing():
@@ -1125,7 +1551,7 @@ class ControlButtons(discord.ui.View):
             # Update embed immediately
             await state.update_embed_now()
             # Log to admin channel
-            await self.cog.admin_logger.log_playback_action(
+            self.cog.admin_logger.log_playback_action(
                 interaction.guild, "Pause", interaction.user
             )
         else:
@@ -1140,7 +1566,7 @@ class ControlButtons(discord.ui.View):
         
         # Log skip to admin channel before skipping
         if state.current:
-            await self.cog.admin_logger.log_track_skip(
+            self.cog.admin_logger.log_track_skip(
                 interaction.guild, state.current, interaction.user, "Manual skip via button"
             )
         
@@ -1168,7 +1594,7 @@ class ControlButtons(discord.ui.View):
         # Update embed immediately to show new loop mode
         await state.update_embed_now()
         # Log to admin channel
-        await self.cog.admin_logger.log_playback_action(
+        self.cog.admin_logger.log_playback_action(
             interaction.guild, "Loop", interaction.user, 
             details=f"Mode: {state.loop_mode.name}"
         )
@@ -1179,7 +1605,7 @@ class ControlButtons(discord.ui.View):
             return
         
         state = self.cog.get_state(self.guild_id)
-        await state.clear_queue()
+        state.clear_queue()
         
         if state.voice_client:
             state.voice_client.stop()
@@ -1190,19 +1616,20 @@ class ControlButtons(discord.ui.View):
         # Stop embed updates
         await state.stop_embed_updates()
         
+        # Acknowledge first; the status clear below is an API call the user shouldn't wait on
+        await interaction.response.send_message("⏹️ Stopped playback and cleared queue.", ephemeral=True)
+        
         # Restore channel name when stopping
         await state.clear_channel_status()
         
         # Log to admin channel
-        await self.cog.admin_logger.log_playback_action(
+        self.cog.admin_logger.log_playback_action(
             interaction.guild, "Stop", interaction.user,
             details="Queue cleared"
         )
         
         # Send session report if there was activity
         await state.send_session_report(self.cog, "Music session ended - Playback stopped")
-        
-        await interaction.response.send_message("⏹️ Stopped playback and cleared queue.", ephemeral=True)
     
     @discord.ui.button(label="Add Song", emoji="➕", style=discord.ButtonStyle.secondary, custom_id="music_add", row=1)
     async def add_song(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -1253,7 +1680,7 @@ class ControlButtons(discord.ui.View):
             channel = state.voice_client.channel
             
             # Log voice event to admin channel
-            await self.cog.admin_logger.log_voice_event(
+            self.cog.admin_logger.log_voice_event(
                 interaction.guild, "Left", channel, interaction.user
             )
             
@@ -1265,7 +1692,7 @@ class ControlButtons(discord.ui.View):
             
             await state.voice_client.disconnect()
             state.voice_client = None
-            await state.clear_queue()
+            state.clear_queue()
             state.current = None
             state.is_playing = False
         
@@ -1282,6 +1709,8 @@ class Music(commands.Cog):
         # Download-first mode configuration
         self.download_first_enabled = os.getenv('DOWNLOAD_FIRST_MODE', 'true').lower() == 'true'
         print(f"Download-first mode: {'enabled' if self.download_first_enabled else 'disabled'}")
+        # Tracks shorter than this many seconds stream instead of downloading first (0 = always download)
+        self.stream_short_tracks_under = int(os.getenv('STREAM_SHORT_TRACKS_UNDER', '0'))
         
         # Control panel positioning
         self.keep_panel_at_bottom = os.getenv('KEEP_PANEL_AT_BOTTOM', 'true').lower() == 'true'
@@ -1293,61 +1722,100 @@ class Music(commands.Cog):
         
         # Admin logging configuration
         self.admin_logger = AdminLogger(self.bot)
+        
+        # Playlist track lookups kept in flight at once (small, to stay clear of YouTube throttling)
+        self.playlist_concurrency = 5
     
     async def cog_load(self):
+        if self.realtime_embed_updates:
+            self.embed_ticker.start()
         print("Music cog loaded successfully")
     
+    @tasks.loop(seconds=EMBED_UPDATE_INTERVAL)
+    async def embed_ticker(self):
+        """Refresh every active now playing embed in one pass per interval."""
+        try:
+            # Paused guilds are skipped; pause/resume refresh their panel directly
+            active = [
+                state for state in self.states.values()
+                if state.embed_updates_active and state.is_playing and state.current
+                and state.now_playing_message
+                and not (state.voice_client and state.voice_client.is_paused())
+            ]
+            if active:
+                await asyncio.gather(*(state.update_embed_now() for state in active))
+        except Exception as e:
+            print(f"Error in embed ticker: {e}")
+    
     async def cog_unload(self):
+        self.embed_ticker.cancel()
         print("Cleaning up music states...")
         async with self.state_lock:
-            for guild_id, state in self.states.items():
-                try:
-                    # Stop embed updates
-                    await state.stop_embed_updates()
-                    
-                    # Restore channel names before cleanup
-                    await state.restore_channel_name()
-                    
-                    if state.voice_client:
-                        await state.voice_client.disconnect()
-                    if state.idle_task:
-                        state.idle_task.cancel()
-                    
-                    # Clean up any downloaded files in queue
-                    for track in state.queue:
-                        if track.is_downloaded:
-                            try:
-                                track.cleanup()
-                            except Exception as cleanup_error:
-                                print(f"Error cleaning up track {track.title}: {cleanup_error}")
-                    
-                    # Clean up current track if downloaded
-                    if state.current and state.current.is_downloaded:
-                        try:
-                            state.current.cleanup()
-                        except Exception as cleanup_error:
-                            print(f"Error cleaning up current track: {cleanup_error}")
-                    
-                    # Clean up channel manager
-                    await state.cleanup_channel_manager()
-                            
-                except Exception as e:
-                    print(f"Error cleaning up guild {guild_id}: {e}")
+            # Guilds are independent, so clean them up concurrently (bounded)
+            semaphore = asyncio.Semaphore(10)
+            
+            async def bounded_cleanup(guild_id: int, state: GuildMusicState):
+                async with semaphore:
+                    await self._unload_state(guild_id, state)
+            
+            await asyncio.gather(
+                *(bounded_cleanup(guild_id, state) for guild_id, state in self.states.items()),
+                return_exceptions=True
+            )
             self.states.clear()
+            _PANEL_CHANNELS.clear()
+        
+        # Stop the admin log sender
+        await self.admin_logger.close()
         
         # Clean up all temporary audio files
         try:
             ytdl_source.cleanup_all_temp_files()
         except Exception as e:
             print(f"Error cleaning up temp files: {e}")
+        
+        # Release the yt-dlp worker threads
+        ytdl_source.close()
+    
+    async def _unload_state(self, guild_id: int, state: GuildMusicState):
+        """Tear down one guild's playback state during cog unload."""
+        try:
+            # Stop embed updates
+            await state.stop_embed_updates()
+            
+            # Clear channel status before cleanup
+            await state.clear_channel_status()
+            
+            if state.voice_client:
+                await state.voice_client.disconnect()
+            if state.idle_task:
+                state.idle_task.cancel()
+            if state.alone_task:
+                state.alone_task.cancel()
+            
+            # Clean up downloaded files (queue and current track) off the event loop
+            downloaded = [track for track in state.queue if track.is_downloaded]
+            if state.current and state.current.is_downloaded:
+                downloaded.append(state.current)
+            results = await asyncio.gather(
+                *(asyncio.to_thread(track.cleanup) for track in downloaded),
+                return_exceptions=True
+            )
+            for track, result in zip(downloaded, results):
+                if isinstance(result, Exception):
+                    print(f"Error cleaning up track {track.title}: {result}")
+            
+            # Clean up channel manager
+            await state.cleanup_channel_manager()
+            
+        except Exception as e:
+            print(f"Error cleaning up guild {guild_id}: {e}")
     
     def get_state(self, guild_id: int) -> GuildMusicState:
-        if guild_id in self.states:
-            return self.states[guild_id]
-        
-        if guild_id not in self.states:
-            self.states[guild_id] = GuildMusicState(self.bot)
-        return self.states[guild_id]
+        state = self.states.get(guild_id)
+        if state is None:
+            state = self.states[guild_id] = GuildMusicState(self.bot)
+        return state
     
     async def cleanup_state(self, guild_id: int):
         async with self.state_lock:
@@ -1367,35 +1835,42 @@ class Music(commands.Cog):
                         await state.voice_client.disconnect()
                     if state.idle_task:
                         state.idle_task.cancel()
+                    if state.alone_task:
+                        state.alone_task.cancel()
+                    if state._status_task:
+                        state._status_task.cancel()
                     
-                    # Clean up downloaded files before clearing queue
-                    for track in state.queue:
-                        if track.is_downloaded:
-                            try:
-                                track.cleanup()
-                            except Exception as cleanup_error:
-                                print(f"Error cleaning up track {track.title}: {cleanup_error}")
-                    
+                    # Clean up downloaded files before clearing queue, off the event loop
+                    downloaded = [track for track in state.queue if track.is_downloaded]
                     if state.current and state.current.is_downloaded:
-                        try:
-                            state.current.cleanup()
-                        except Exception as cleanup_error:
-                            print(f"Error cleaning up current track: {cleanup_error}")
+                        downloaded.append(state.current)
+                    results = await asyncio.gather(
+                        *(asyncio.to_thread(track.cleanup) for track in downloaded),
+                        return_exceptions=True
+                    )
+                    for track, result in zip(downloaded, results):
+                        if isinstance(result, Exception):
+                            print(f"Error cleaning up track {track.title}: {result}")
                     
                     # Clean up channel manager
                     await state.cleanup_channel_manager()
                     
-                    await state.clear_queue()
+                    state.clear_queue()
                 except Exception as e:
                     print(f"Error cleaning up state for guild {guild_id}: {e}")
                 finally:
+                    state.now_playing_message = None  # Drop its panel channel from _PANEL_CHANNELS
                     del self.states[guild_id]
     
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
         """Monitor messages to keep control panel at bottom of channel."""
+        # Most messages are in channels without a panel - reject those first
+        if message.channel.id not in _PANEL_CHANNELS:
+            return
+        
         # Skip if feature is disabled
-        if not hasattr(self, 'keep_panel_at_bottom') or not self.keep_panel_at_bottom:
+        if not self.keep_panel_at_bottom:
             return
         
         # Ignore DMs
@@ -1425,8 +1900,8 @@ class Music(commands.Cog):
         if message.channel.id != state.now_playing_message.channel.id:
             return
         
-        # Move the control panel to the bottom (pass self as music_cog)
-        await state.move_panel_to_bottom(self)
+        # Move the control panel to the bottom, at most once per cooldown
+        state.schedule_panel_move(self)
     
     @commands.Cog.listener()
     async def on_guild_remove(self, guild: discord.Guild):
@@ -1443,7 +1918,7 @@ class Music(commands.Cog):
             if before.channel and not after.channel:
                 # Bot was disconnected from voice channel
                 # Log voice event to admin channel
-                await self.admin_logger.log_voice_event(
+                self.admin_logger.log_voice_event(
                     member.guild, "Disconnected", before.channel
                 )
                 
@@ -1459,14 +1934,14 @@ class Music(commands.Cog):
                 # Send session report
                 await state.send_session_report(self, "Music session ended - Bot disconnected from voice")
                 
-                await state.clear_queue()
+                state.clear_queue()
                 state.current = None
                 state.is_playing = False
                 return
             
             if not before.mute and after.mute:
                 # Bot was server muted
-                await self.admin_logger.log_playback_action(
+                self.admin_logger.log_playback_action(
                     member.guild, "Server Mute", member,
                     details="Bot was server muted, playback paused"
                 )
@@ -1478,7 +1953,7 @@ class Music(commands.Cog):
             
             if before.mute and not after.mute:
                 # Bot was server unmuted
-                await self.admin_logger.log_playback_action(
+                self.admin_logger.log_playback_action(
                     member.guild, "Server Unmute", member,
                     details="Bot was server unmuted, playback resumed"
                 )
@@ -1490,7 +1965,7 @@ class Music(commands.Cog):
             
             if not before.deaf and after.deaf:
                 # Bot was server deafened
-                await self.admin_logger.log_playback_action(
+                self.admin_logger.log_playback_action(
                     member.guild, "Server Deafen", member,
                     details="Bot was server deafened"
                 )
@@ -1498,7 +1973,7 @@ class Music(commands.Cog):
             
             if before.deaf and not after.deaf:
                 # Bot was server undeafened
-                await self.admin_logger.log_playback_action(
+                self.admin_logger.log_playback_action(
                     member.guild, "Server Undeafen", member,
                     details="Bot was server undeafened"
                 )
@@ -1507,34 +1982,57 @@ class Music(commands.Cog):
         if guild_id in self.states:
             state = self.states[guild_id]
             if state.voice_client and state.voice_client.channel:
-                members = [m for m in state.voice_client.channel.members if not m.bot]
+                # Only events touching the bot's channel can change who is listening
+                channel_id = state.voice_client.channel.id
+                if not ((before.channel and before.channel.id == channel_id) or
+                        (after.channel and after.channel.id == channel_id)):
+                    return
                 
-                if len(members) == 0:
-                    print(f"[Guild {guild_id}] Bot alone in voice, will disconnect in 60s")
-                    # Log to admin channel
-                    await self.admin_logger.log_voice_event(
-                        state.voice_client.guild, "Alone in Channel",
-                        state.voice_client.channel,
-                        None
-                    )
-                    await asyncio.sleep(60)
-                    
-                    if state.voice_client and state.voice_client.channel:
-                        members = [m for m in state.voice_client.channel.members if not m.bot]
-                        if len(members) == 0:
-                            print(f"[Guild {guild_id}] Auto-leaving voice channel (alone)")
-                            # Log auto-disconnect to admin channel
-                            await self.admin_logger.log_voice_event(
-                                state.voice_client.guild, "Auto-Disconnect (Alone)",
-                                state.voice_client.channel,
-                                None
-                            )
-                            
-                            # Send session report
-                            await state.send_session_report(self, "Music session ended - Bot alone in voice channel")
-                            
-                            await state.voice_client.disconnect()
-                            await self.cleanup_state(guild_id)
+                has_listeners = state.human_listener_count(refresh=True) > 0
+                
+                if not has_listeners:
+                    # Start the countdown once; later events while still alone don't restart it
+                    if state.alone_task is None or state.alone_task.done():
+                        print(f"[Guild {guild_id}] Bot alone in voice, will disconnect in 60s")
+                        # Log to admin channel
+                        self.admin_logger.log_voice_event(
+                            state.voice_client.guild, "Alone in Channel",
+                            state.voice_client.channel,
+                            None
+                        )
+                        state.alone_task = asyncio.create_task(self._alone_disconnect(guild_id))
+                elif state.alone_task:
+                    # Someone is back - call off the pending disconnect
+                    state.alone_task.cancel()
+                    state.alone_task = None
+    
+    async def _alone_disconnect(self, guild_id: int):
+        """Leave the voice channel if the bot is still alone after 60 seconds."""
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            return
+        
+        state = self.states.get(guild_id)
+        if not state:
+            return
+        state.alone_task = None
+        
+        if state.voice_client and state.voice_client.channel:
+            if not any(not m.bot for m in state.voice_client.channel.members):
+                print(f"[Guild {guild_id}] Auto-leaving voice channel (alone)")
+                # Log auto-disconnect to admin channel
+                self.admin_logger.log_voice_event(
+                    state.voice_client.guild, "Auto-Disconnect (Alone)",
+                    state.voice_client.channel,
+                    None
+                )
+                
+                # Send session report
+                await state.send_session_report(self, "Music session ended - Bot alone in voice channel")
+                
+                await state.voice_client.disconnect()
+                await self.cleanup_state(guild_id)
     
     async def _ensure_voice(self, interaction: discord.Interaction) -> bool:
         if not interaction.user.voice:
@@ -1549,9 +2047,15 @@ class Music(commands.Cog):
             print(f"Error getting state for guild {guild_id}: {e}")
             return
         
+        # Overlapping calls would race on voice_client.play; let the first one win
+        if state._advancing:
+            return
+        state._advancing = True
+        
         track = await state.next_track()
         
         if not track:
+            state._advancing = False
             state.is_playing = False
             state.reset_idle_timer()
             
@@ -1564,7 +2068,7 @@ class Music(commands.Cog):
             
             # Log queue finish to admin channel
             if state.voice_client:
-                await self.admin_logger.log_playback_action(
+                self.admin_logger.log_playback_action(
                     state.voice_client.guild, "Queue Finished", state.voice_client.guild.me,
                     details="All tracks completed, playback stopped"
                 )
@@ -1590,6 +2094,7 @@ class Music(commands.Cog):
             # Check if voice client is still valid
             if not state.voice_client or not state.voice_client.is_connected():
                 print(f"Voice client disconnected for guild {guild_id}")
+                state._advancing = False
                 state.is_playing = False
                 return
             
@@ -1614,9 +2119,9 @@ class Music(commands.Cog):
                     **FFMPEG_PCM_OPTIONS
                 )
             
-            # Wrap with volume transformer
+            # Wrap with volume transformer (skipped at 100%)
             # Note: Volume transformer should NOT cause speed issues if FFmpeg settings are correct
-            audio_source = discord.PCMVolumeTransformer(audio_source, volume=state.volume)
+            audio_source = state.apply_volume(audio_source)
             
             # Play the track
             def after_playing(error):
@@ -1635,26 +2140,23 @@ class Music(commands.Cog):
                     self._play_next(guild_id),
                     self.bot.loop
                 )
-                # Add error handler for the future
-                try:
-                    future.result(timeout=0.1)
-                except:
-                    pass
+                # Report failures from the loop instead of blocking this thread on the result
+                def report_error(fut):
+                    if not fut.cancelled() and fut.exception():
+                        print(f"[Guild {guild_id}] Error advancing to next track: {fut.exception()}")
+                future.add_done_callback(report_error)
             
             state.voice_client.play(audio_source, after=after_playing)
             state.is_playing = True
+            state.queue_drained.set()
+            # Release the guard now so a track that ends instantly can still advance
+            state._advancing = False
             
             # Record track play for session tracking
             state.record_track_play(track)
             
             # Log track play to admin channel
-            # If playlist, show position in playlist
-            if state.current_playlist:
-                position_str = f"Track {state.playlist_track_index} of {state.current_playlist['total']} (Playlist: {state.current_playlist['title'][:50]})"
-            else:
-                position_str = f"Session #{state.current_position}"
-            
-            await self.admin_logger.log_track_play(
+            self.admin_logger.log_track_play(
                 state.voice_client.guild,
                 track,
                 track.requester,
@@ -1665,8 +2167,8 @@ class Music(commands.Cog):
             if state.idle_task:
                 state.idle_task.cancel()
             
-            # Update voice channel name to show current track
-            await state.update_channel_name_for_track(track)
+            # Update voice channel status in the background (debounced)
+            state.schedule_channel_status(track)
             
             # Send now playing embed with buttons
             await self._send_now_playing(state, track)
@@ -1675,18 +2177,20 @@ class Music(commands.Cog):
             print(f"[Guild {guild_id}] Error playing track {track.title}: {e}")
             # Log error to admin channel
             if state.voice_client:
-                await self.admin_logger.log_error(
+                self.admin_logger.log_error(
                     state.voice_client.guild, "Playback Error", str(e),
                     context=f"Error playing track: {track.title}"
                 )
-            # Auto-skip to next track on error
-            asyncio.create_task(self._play_next(guild_id))
+            state._advancing = False
+            # If the track did start, its after-callback advances instead
+            if state.voice_client and state.voice_client.is_playing():
+                return
             if state.now_playing_message:
                 try:
                     # Update existing embed to show error state
                     embed = discord.Embed(
                         title="❌ Playback Error",
-                        description=f"🚫 *Failed to play* **{track.title[:100]}**\n\n⏭️ Automatically skipping to next track...",
+                        description=f"🚫 *Failed to play* **{track.title_100}**\n\n⏭️ Automatically skipping to next track...",
                         color=discord.Color.red()
                     )
                     embed.add_field(name="🔧 Troubleshooting", value="This usually happens with unavailable videos", inline=False)
@@ -1695,7 +2199,7 @@ class Music(commands.Cog):
                 except Exception as send_error:
                     print(f"[Guild {guild_id}] Error updating error message: {send_error}")
             
-            # Try next track (with error handling)
+            # Auto-skip to next track (with error handling)
             try:
                 await self._play_next(guild_id)
             except Exception as next_error:
@@ -1707,55 +2211,14 @@ class Music(commands.Cog):
         if not state.now_playing_message or not state.current:
             return
         
-        try:
-            # Get the current embed
-            current_embed = state.now_playing_message.embeds[0] if state.now_playing_message.embeds else None
-            if not current_embed:
-                return
-            
-            # Update queue preview
-            if len(current_embed.fields) >= 7:  # Make sure we have the "Up Next" field
-                # Find and update the "Up Next" field (usually the last field before footer)
-                for i, field in enumerate(current_embed.fields):
-                    if field.name == "⏭️ Up Next":
-                        if len(state.queue) > 0:
-                            next_track = state.queue[0]
-                            next_title = next_track.title[:35] + "..." if len(next_track.title) > 35 else next_track.title
-                            next_info = f"**{next_title}**\n⏱️ `{next_track.duration_str}` • 👤 {next_track.requester.display_name}"
-                            current_embed.set_field_at(i, name="⏭️ Up Next", value=next_info, inline=False)
-                        else:
-                            current_embed.set_field_at(i, name="⏭️ Up Next", value="*Queue is empty - add more songs!*", inline=False)
-                        break
-            
-            # Update footer with new queue count and duration
-            queue_duration = sum(t.duration for t in state.queue if t.duration)
-            queue_time_str = YTDLSource.format_duration(queue_duration) if queue_duration > 0 else "0:00"
-            playback_mode = "📁 Downloaded" if state.current.is_downloaded else "🌐 Streaming"
-            footer_text = f"{playback_mode} • {len(state.queue)} in queue • {queue_time_str} remaining"
-            current_embed.set_footer(text=footer_text, icon_url=state.current.requester.display_avatar.url)
-            
-            # Edit the message with updated embed
-            await state.now_playing_message.edit(embed=current_embed)
-            
-        except (discord.NotFound, discord.Forbidden, discord.HTTPException) as e:
-            print(f"Could not update now playing embed: {e}")
-        except Exception as e:
-            print(f"Unexpected error updating now playing embed: {e}")
+        # Goes through the coalesced refresh, which skips the edit if the
+        # rendered state matches what the message already shows
+        state.request_embed_update()
     
     async def _send_now_playing(self, state: GuildMusicState, track: Track):
         """Send or update now playing embed with control buttons."""
-        import time
-        
         # Set track start time for progress calculation
-        state.track_start_time = time.time()
-        
-        # Delete previous now playing message to keep chat clean
-        if state.now_playing_message:
-            try:
-                await state.now_playing_message.delete()
-                state.now_playing_message = None
-            except (discord.NotFound, discord.Forbidden, discord.HTTPException) as e:
-                print(f"Could not delete previous now playing message: {e}")
+        state.track_start_time = _now()
         
         # Create embed using the state's method
         embed = await state._create_now_playing_embed()
@@ -1764,18 +2227,35 @@ class Music(commands.Cog):
             return
         
         # Create buttons view
-        view = ControlButtons(self, state.voice_client.guild.id)
+        view = state.get_control_view(self)
+        
+        # Same channel: edit the existing panel in place (one request instead of delete + send)
+        previous = state.now_playing_message
+        if previous and state.text_channel and previous.channel.id == state.text_channel.id:
+            try:
+                await previous.edit(embed=embed, view=view)
+                await state.start_embed_updates(self)
+                return
+            except discord.NotFound:
+                state.now_playing_message = None
+            except (discord.Forbidden, discord.HTTPException) as e:
+                print(f"Could not edit previous now playing message: {e}")
+        
+        # Delete previous now playing message to keep chat clean
+        if state.now_playing_message:
+            try:
+                await state.now_playing_message.delete()
+                state.now_playing_message = None
+            except (discord.NotFound, discord.Forbidden, discord.HTTPException) as e:
+                print(f"Could not delete previous now playing message: {e}")
         
         # Send message with better error handling
         try:
-            # Use the stored text channel, or fall back to the previous message's channel
-            if state.text_channel:
-                channel = state.text_channel
-            elif state.now_playing_message:
-                channel = state.now_playing_message.channel
-            else:
-                # Last resort fallback
-                channel = state.voice_client.guild.text_channels[0]
+            # The text channel is stored when playback is started from a command
+            channel = state.text_channel
+            if channel is None:
+                print("No text channel stored for now playing message")
+                return
             
             message = await channel.send(embed=embed, view=view)
             state.now_playing_message = message
@@ -1809,12 +2289,12 @@ class Music(commands.Cog):
             try:
                 state.voice_client = await interaction.user.voice.channel.connect()
                 # Log voice join to admin channel
-                await self.admin_logger.log_voice_event(
+                self.admin_logger.log_voice_event(
                     interaction.guild, "Joined", interaction.user.voice.channel, interaction.user
                 )
             except Exception as e:
                 # Log error to admin channel
-                await self.admin_logger.log_error(
+                self.admin_logger.log_error(
                     interaction.guild, "Voice Connection Error", str(e),
                     context="Failed to connect to voice channel"
                 )
@@ -1822,7 +2302,7 @@ class Music(commands.Cog):
                 return
         
         # Check if it's a playlist URL
-        is_playlist = 'list=' in query or 'playlist' in query.lower()
+        is_playlist = _PLAYLIST_RE.search(query) is not None
         
         try:
             if is_playlist:
@@ -1839,8 +2319,18 @@ class Music(commands.Cog):
         """Handle adding a single track with download-first approach."""
         track_info = None
         
-        # Try download-first approach if enabled
-        if self.download_first_enabled:
+        # Try download-first approach if enabled; cached URLs skip the up-front
+        # extraction and go straight to download_track's cache hit
+        if self.download_first_enabled and self.stream_short_tracks_under > 0 and not ytdl_source.is_cached(query):
+            # Resolve first so short tracks can start streaming right away
+            stream_info = await ytdl_source.get_track_info(query)
+            if stream_info and 0 < (stream_info['duration'] or 0) < self.stream_short_tracks_under:
+                track_info = stream_info
+            else:
+                # Download by resolved URL so searches aren't repeated
+                download_query = stream_info['webpage_url'] if stream_info else query
+                track_info = await ytdl_source.download_track(download_query) or stream_info
+        elif self.download_first_enabled:
             track_info = await ytdl_source.download_track(query)
             
             # Fallback to streaming if download fails
@@ -1863,12 +2353,10 @@ class Music(commands.Cog):
             return
         
         track = Track(track_info, interaction.user)
-        # Store reference to ytdl_source for cleanup
-        track._ytdl_source = ytdl_source
-        await state.add_track(track)
+        state.add_track(track)
         
         # Log queue update to admin channel
-        await self.admin_logger.log_queue_update(
+        self.admin_logger.log_queue_update(
             interaction.guild, "Added", track, interaction.user
         )
         
@@ -1890,8 +2378,8 @@ class Music(commands.Cog):
         
         # Show estimated wait time (fix: account for current track if playing)
         if len(state.queue) > 1:
-            queue_before = state.queue[:-1]  # All tracks except the one just added
-            wait_time = sum(t.duration for t in queue_before if t.duration)
+            # All tracks except the one just added
+            wait_time = state.queue.total_duration - (state.queue[-1].duration or 0)
             # Add current track remaining time if something is playing
             if state.current and state.current.duration:
                 wait_time += state.current.duration
@@ -1908,7 +2396,7 @@ class Music(commands.Cog):
             embed.set_thumbnail(url=track.thumbnail)
         
         # Enhanced footer
-        total_queue_time = sum(t.duration for t in state.queue if t.duration)
+        total_queue_time = state.queue.total_duration
         queue_time_str = YTDLSource.format_duration(total_queue_time) if total_queue_time > 0 else "0:00"
         embed.set_footer(
             text=f"Queue: {len(state.queue)} tracks • Total time: {queue_time_str}",
@@ -1922,7 +2410,7 @@ class Music(commands.Cog):
                 await self._update_now_playing_embed(state)
                 # Send brief ephemeral confirmation
                 await interaction.followup.send(
-                    f"✅ **Added to queue:** {track.title[:50]}{'...' if len(track.title) > 50 else ''}",
+                    f"✅ **Added to queue:** {track.title_50}",
                     ephemeral=True
                 )
             except Exception as e:
@@ -1966,7 +2454,7 @@ class Music(commands.Cog):
             'title': playlist_info['title'],
             'total': total_tracks,
             'added_by': interaction.user,
-            'added_at': time.time(),
+            'added_at': _now(),
             'duration': total_duration
         }
         state.playlist_track_index = 0
@@ -1988,7 +2476,7 @@ class Music(commands.Cog):
         await interaction.followup.send(embed=embed)
         
         # Log playlist addition to admin channel
-        await self.admin_logger.log_playlist_added(
+        self.admin_logger.log_playlist_added(
             interaction.guild,
             playlist_info['title'],
             total_tracks,
@@ -2003,7 +2491,6 @@ class Music(commands.Cog):
         
         if first_track_info:
             first_track = Track(first_track_info, interaction.user)
-            first_track._ytdl_source = ytdl_source
             # Add track without incrementing total_tracks (already counted)
             async with state.lock:
                 state.queue.append(first_track)
@@ -2038,25 +2525,40 @@ class Music(commands.Cog):
         
         print(f"[Guild {guild_id}] Fetching {len(entries)} remaining playlist tracks in background...")
         
-        # Process in batches for efficiency - preload only a few at a time
-        batch_size = 5  # Preload 5 tracks at a time for responsiveness
-        
-        for i, entry in enumerate(entries, start=2):
+        # Keep a small window of lookups in flight, but consume them in
+        # playlist order so the queue order matches the playlist
+        pending: Deque[Tuple[int, dict, asyncio.Task]] = deque()
+        upcoming = enumerate(entries, start=2)
+        
+        def fill_window():
+            while len(pending) < self.playlist_concurrency:
+                item = next(upcoming, None)
+                if item is None:
+                    return
+                i, entry = item
+                pending.append((i, entry, asyncio.create_task(ytdl_source.get_track_info(entry['url']))))
+        
+        fill_window()
+        while pending:
+            i, entry, fetch = pending.popleft()
+            fill_window()
             try:
                 # Check if state is still valid (bot might have left guild)
                 if guild_id not in self.states:
                     print(f"[Guild {guild_id}] State removed, stopping playlist fetch")
+                    fetch.cancel()
                     break
                 
                 # If queue is getting large and we're far ahead, slow down
                 while len(state.queue) > 20 and not state.is_playing:
-                    await asyncio.sleep(1)  # Wait for playback to catch up
+                    # Wait for playback to catch up; set by _play_next and clear_queue
+                    state.queue_drained.clear()
+                    await state.queue_drained.wait()
                 
-                track_info = await ytdl_source.get_track_info(entry['url'])
+                track_info = await fetch
                 
                 if track_info:
                     track = Track(track_info, requester)
-                    track._ytdl_source = ytdl_source
                     # Add track without incrementing total_tracks (already set for playlist)
                     async with state.lock:
                         state.queue.append(track)
@@ -2074,6 +2576,10 @@ class Music(commands.Cog):
                 # Don't let one failure stop the whole playlist
                 continue
         
+        # Stopped early - drop lookups that are still in flight
+        for _, _, fetch in pending:
+            fetch.cancel()
+        
         # NO completion message - keep channel clean
         # Just adjust total_tracks if some failed and log to console
         if failed_count > 0:
@@ -2134,7 +2640,10 @@ class Music(commands.Cog):
             await interaction.response.send_message("❌ Bot is not in a voice channel.", ephemeral=True)
             return
         
-        await state.clear_queue()
+        # Acknowledge before the channel status request so a slow API can't expire the interaction
+        await interaction.response.defer(ephemeral=True)
+        
+        state.clear_queue()
         state.voice_client.stop()
         state.current = None
         state.is_playing = False
@@ -2142,7 +2651,7 @@ class Music(commands.Cog):
         # Restore channel name when stopping
         await state.clear_channel_status()
         
-        await interaction.response.send_message("⏹️ Stopped playback and cleared queue.", ephemeral=True)
+        await interaction.followup.send("⏹️ Stopped playback and cleared queue.", ephemeral=True)
     
     @app_commands.command(name="queue", description="Show the current queue")
     async def queue(self, interaction: discord.Interaction):
@@ -2172,12 +2681,13 @@ class Music(commands.Cog):
         """Shuffle the queue."""
         state = self.get_state(interaction.guild.id)
         
-        if len(state.queue) < 2:
+        count = len(state.queue)
+        if count < 2:
             await interaction.response.send_message("❌ Not enough tracks in queue to shuffle.", ephemeral=True)
             return
         
-        await state.shuffle_queue()
-        await interaction.response.send_message(f"🔀 Shuffled {len(state.queue)} tracks.", ephemeral=True)
+        state.shuffle_queue()
+        await interaction.response.send_message(f"🔀 Shuffled {count} tracks.", ephemeral=True)
     
     @app_commands.command(name="loop", description="Toggle loop mode (off/track/queue)")
     @app_commands.describe(mode="Loop mode: off, track, or queue")
@@ -2190,13 +2700,7 @@ class Music(commands.Cog):
         """Set loop mode."""
         state = self.get_state(interaction.guild.id)
         
-        mode_map = {
-            "off": (LoopMode.OFF, "➡️ Loop disabled."),
-            "track": (LoopMode.TRACK, "🔂 Looping current track."),
-            "queue": (LoopMode.QUEUE, "🔁 Looping queue."),
-        }
-        
-        new_mode, message = mode_map[mode.value]
+        new_mode, message = _LOOP_MODE_MAP[mode.value]
         state.loop_mode = new_mode
         
         await interaction.response.send_message(message, ephemeral=True)
@@ -2212,36 +2716,15 @@ class Music(commands.Cog):
         
         track = state.current
         
-        # Enhanced color scheme
-        colors = [
-            discord.Color.blue(), discord.Color.purple(), discord.Color.magenta(), 
-            discord.Color.teal(), discord.Color.green(), discord.Color.orange(),
-            discord.Color.red(), discord.Color.gold()
-        ]
-        color = colors[state.current_position % len(colors)]
-        
-        embed = discord.Embed(
-            title="🎵 Currently Playing",
-            description=f"**[{track.title}]({track.webpage_url})**\n\n🎶 *Now streaming for your enjoyment*",
-            color=color
-        )
-        
-        # First row
-        embed.add_field(name="📺 Channel", value=f"`{track.uploader}`", inline=True)
-        embed.add_field(name="⏱️ Duration", value=f"`{track.duration_str}`", inline=True)
-        embed.add_field(name="👤 Requested by", value=track.requester.mention, inline=True)
+        # Title, color, first row and thumbnail are built once per track
+        embed = state.get_now_template().copy()
         
         # Second row
         embed.add_field(name="📊 Track Position", value=f"`{state.current_position}` / `{state.total_tracks}`", inline=True)
         embed.add_field(name="🔊 Volume", value=f"`{int(state.volume * 100)}%`", inline=True)
         
         # Loop status with enhanced formatting
-        loop_icons = {
-            LoopMode.OFF: "➡️ **Off**",
-            LoopMode.TRACK: "🔂 **Track**",
-            LoopMode.QUEUE: "🔁 **Queue**"
-        }
-        embed.add_field(name="🔁 Loop Mode", value=loop_icons[state.loop_mode], inline=True)
+        embed.add_field(name="🔁 Loop Mode", value=_LOOP_ICONS[state.loop_mode.value], inline=True)
         
         # Playback info
         playback_mode = "📁 **Downloaded**" if track.is_downloaded else "🌐 **Streaming**"
@@ -2249,22 +2732,19 @@ class Music(commands.Cog):
         
         # Voice channel info
         if state.voice_client and state.voice_client.channel:
-            channel_members = len([m for m in state.voice_client.channel.members if not m.bot])
+            channel_members = state.human_listener_count()
             embed.add_field(name="🎧 Listeners", value=f"`{channel_members}` members", inline=True)
         
         # Queue preview
         if len(state.queue) > 0:
             next_track = state.queue[0]
-            next_title = next_track.title[:30] + "..." if len(next_track.title) > 30 else next_track.title
+            next_title = _truncate(next_track.title, 30)
             embed.add_field(name="⏭️ Up Next", value=f"**{next_title}**", inline=True)
         else:
             embed.add_field(name="⏭️ Up Next", value="*Queue empty*", inline=True)
         
-        if track.thumbnail:
-            embed.set_thumbnail(url=track.thumbnail)
-        
         # Enhanced footer with more details
-        queue_duration = sum(t.duration for t in state.queue if t.duration)
+        queue_duration = state.queue.total_duration
         queue_time_str = YTDLSource.format_duration(queue_duration) if queue_duration > 0 else "0:00"
         
         footer_text = f"{len(state.queue)} tracks in queue • {queue_time_str} remaining"
@@ -2293,8 +2773,12 @@ class Music(commands.Cog):
         state.volume = level / 100.0
         
         # If currently playing, update the volume in real-time
-        if state.voice_client.source and isinstance(state.voice_client.source, discord.PCMVolumeTransformer):
-            state.voice_client.source.volume = state.volume
+        source = state.voice_client.source
+        if source and isinstance(source, discord.PCMVolumeTransformer):
+            source.volume = state.volume
+        elif source and state.volume != 1.0:
+            # Track started at 100% without a transformer; wrap it now
+            state.voice_client.source = state.apply_volume(source)
         
         await interaction.response.send_message(f"🔊 Volume set to {level}%.", ephemeral=True)
     
@@ -2314,26 +2798,30 @@ class Music(commands.Cog):
                 return
             else:
                 # Move to the new channel
+                await interaction.response.defer(ephemeral=True)
                 await state.voice_client.move_to(interaction.user.voice.channel)
-                await interaction.response.send_message(f"✅ Moved to {interaction.user.voice.channel.mention}.", ephemeral=True)
+                await interaction.followup.send(f"✅ Moved to {interaction.user.voice.channel.mention}.", ephemeral=True)
                 return
         
+        # Connecting can take longer than the interaction ack window
+        await interaction.response.defer(ephemeral=True)
+        
         # Connect to voice channel
         try:
             state.voice_client = await interaction.user.voice.channel.connect()
             state.text_channel = interaction.channel
             # Log voice join to admin channel
-            await self.admin_logger.log_voice_event(
+            self.admin_logger.log_voice_event(
                 interaction.guild, "Joined", interaction.user.voice.channel, interaction.user
             )
-            await interaction.response.send_message(f"✅ Joined {interaction.user.voice.channel.mention}.", ephemeral=True)
+            await interaction.followup.send(f"✅ Joined {interaction.user.voice.channel.mention}.", ephemeral=True)
         except Exception as e:
             # Log error to admin channel
-            await self.admin_logger.log_error(
+            self.admin_logger.log_error(
                 interaction.guild, "Voice Connection Error", str(e),
                 context="Failed to join voice channel via /join command"
             )
-            await interaction.response.send_message(f"❌ Failed to join voice channel: {e}", ephemeral=True)
+            await interaction.followup.send(f"❌ Failed to join voice channel: {e}", ephemeral=True)
     
     @app_commands.command(name="leave", description="Disconnect the bot from voice channel")
     async def leave(self, interaction: discord.Interaction):
@@ -2344,15 +2832,18 @@ class Music(commands.Cog):
             await interaction.response.send_message("❌ Bot is not in a voice channel.", ephemeral=True)
             return
         
+        # Acknowledge first; the status clear and disconnect are both API round-trips
+        await interaction.response.defer(ephemeral=True)
+        
         # Restore channel name before leaving
         await state.clear_channel_status()
         await state.voice_client.disconnect()
         state.voice_client = None
-        await state.clear_queue()
+        state.clear_queue()
         state.current = None
         state.is_playing = False
         
-        await interaction.response.send_message("👋 Disconnected from voice channel.", ephemeral=True)
+        await interaction.followup.send("👋 Disconnected from voice channel.", ephemeral=True)
     
     @app_commands.command(name="remove", description="Remove a track from the queue by position")
     @app_commands.describe(position="Position of track to remove (1 for first in queue)")
@@ -2370,22 +2861,17 @@ class Music(commands.Cog):
         
         # Remove track (convert to 0-indexed)
         async with state.lock:
-            removed_track = state.queue.pop(position - 1)
+            removed_track = state.queue[position - 1]
+            del state.queue[position - 1]
             state.total_tracks -= 1
+        removed_track.release_cache()
         
-        embed = discord.Embed(
-            title="🗑️ Track Removed",
-            description=f"🎵 *Successfully removed from queue*",
-            color=discord.Color.orange()
+        # Plain-text confirmation; an embed adds nothing for a one-line ack
+        await interaction.response.send_message(
+            f"🗑️ Removed **{removed_track.title_50}** (position `#{position}`, "
+            f"requested by {removed_track.requester.mention}). Queue now has {len(state.queue)} tracks.",
+            ephemeral=True
         )
-        
-        title = removed_track.title[:50] + "..." if len(removed_track.title) > 50 else removed_track.title
-        embed.add_field(name="🎶 Track", value=f"**{title}**", inline=False)
-        embed.add_field(name="📊 Was at Position", value=f"`#{position}`", inline=True)
-        embed.add_field(name="👤 Requested by", value=removed_track.requester.mention, inline=True)
-        embed.set_footer(text=f"Queue now has {len(state.queue)} tracks")
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
     
     @app_commands.command(name="clear", description="Clear the entire queue")
     async def clear(self, interaction: discord.Interaction):
@@ -2397,19 +2883,14 @@ class Music(commands.Cog):
             return
         
         cleared_count = len(state.queue)
-        await state.clear_queue()
+        state.clear_queue()
         
-        embed = discord.Embed(
-            title="🗑️ Queue Cleared",
-            description=f"🧹 *Successfully cleared the queue*",
-            color=discord.Color.orange()
+        # Plain-text confirmation; an embed adds nothing for a one-line ack
+        current_note = "Current track is still playing - use `/stop` to stop it." if state.current else "Add songs with `/play`."
+        await interaction.response.send_message(
+            f"🗑️ Cleared `{cleared_count}` tracks from the queue. {current_note}",
+            ephemeral=True
         )
-        embed.add_field(name="🗂️ Tracks Removed", value=f"`{cleared_count}` tracks", inline=True)
-        embed.add_field(name="🎵 Current Track", value="*Still playing*" if state.current else "*None*", inline=True)
-        embed.add_field(name="💡 Tip", value="Use `/stop` to stop current playback", inline=True)
-        embed.set_footer(text="Queue is now empty - add songs with /play")
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
     
     @app_commands.command(name="voteskip", description="Vote to skip the current track")
     async def voteskip(self, interaction: discord.Interaction):
@@ -2427,7 +2908,7 @@ class Music(commands.Cog):
             await interaction.response.send_message("❌ You must be in the same voice channel as the bot.", ephemeral=True)
             return
         
-        members_count = len([m for m in state.voice_client.channel.members if not m.bot])
+        members_count = state.human_listener_count()
         needed = max(2, int(members_count * state.skip_threshold))
         
         state.skip_votes.add(interaction.user.id)
@@ -2451,11 +2932,18 @@ class Music(commands.Cog):
             await interaction.response.send_message("❌ No previous track available.", ephemeral=True)
             return
         
+        previous_track = state.previous
         async with state.lock:
-            state.queue.insert(0, state.previous)
+            state.queue.appendleft(previous_track)
         
-        await state.skip()
-        await interaction.response.send_message(f"⏮️ Playing previous track: **{state.previous.title}**")
+        if state.voice_client.is_playing() or state.voice_client.is_paused():
+            # The after-callback advances to the re-queued track
+            state.voice_client.stop()
+            await interaction.response.send_message(f"⏮️ Playing previous track: **{previous_track.title}**")
+        else:
+            # Nothing playing, so there is no callback to wait for; start it directly
+            await interaction.response.send_message(f"⏮️ Playing previous track: **{previous_track.title}**")
+            await self._play_next(interaction.guild.id)
     
     @app_commands.command(name="pl-skip", description="Cancel and clear the entire playlist")
     async def pl_skip(self, interaction: discord.Interaction):
@@ -2466,11 +2954,14 @@ class Music(commands.Cog):
             await interaction.response.send_message("❌ No playlist is currently playing. Use `/skip` for single tracks.", ephemeral=True)
             return
         
+        # Acknowledge first; the panel delete below is an API round-trip
+        await interaction.response.defer()
+        
         playlist_info = state.current_playlist
         tracks_remaining = len(state.queue)
         
         # Log playlist cancellation to admin channel
-        await self.admin_logger.log_playlist_stopped(
+        self.admin_logger.log_playlist_stopped(
             interaction.guild,
             playlist_info['title'],
             tracks_remaining,
@@ -2483,7 +2974,7 @@ class Music(commands.Cog):
             state.voice_client.stop()
         
         # Clear the entire queue
-        await state.clear_queue()
+        state.clear_queue()
         
         # Reset playlist metadata
         state.current_playlist = None
@@ -2499,9 +2990,9 @@ class Music(commands.Cog):
         if state.now_playing_message:
             try:
                 await state.now_playing_message.delete()
-                state.now_playing_message = None
-            except:
+            except (discord.NotFound, discord.Forbidden, discord.HTTPException):
                 pass
+            state.now_playing_message = None
         
         # Send confirmation
         embed = discord.Embed(
@@ -2514,7 +3005,7 @@ class Music(commands.Cog):
         embed.add_field(name="👤 Cancelled by", value=interaction.user.mention, inline=True)
         embed.set_footer(text="Use /play to start a new playlist or song")
         
-        await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed)
     
     @app_commands.command(name="pl-stop", description="Stop the playlist and clear its queue")
     async def pl_stop(self, interaction: discord.Interaction):
@@ -2525,11 +3016,14 @@ class Music(commands.Cog):
             await interaction.response.send_message("❌ No playlist is currently playing.", ephemeral=True)
             return
         
+        # Acknowledge first; the channel status clear below is an API round-trip
+        await interaction.response.defer(ephemeral=True)
+        
         playlist_info = state.current_playlist
         tracks_remaining = len(state.queue)
         
         # Log playlist stop to admin channel
-        await self.admin_logger.log_playlist_stopped(
+        self.admin_logger.log_playlist_stopped(
             interaction.guild,
             playlist_info['title'],
             tracks_remaining,
@@ -2541,7 +3035,7 @@ class Music(commands.Cog):
         state.playlist_track_index = 0
         
         # Clear queue and stop playback
-        await state.clear_queue()
+        state.clear_queue()
         
         if state.voice_client:
             state.voice_client.stop()
@@ -2555,7 +3049,7 @@ class Music(commands.Cog):
         # Restore channel name
         await state.clear_channel_status()
         
-        await interaction.response.send_message(
+        await interaction.followup.send(
             f"⏹️ Stopped playlist: **{playlist_info['title']}**\n"
             f"📊 {tracks_remaining} tracks removed from queue",
             ephemeral=True
@@ -2627,14 +3121,6 @@ class Music(commands.Cog):
         
         pl = state.current_playlist
         
-        def format_time(seconds: int) -> str:
-            hours = seconds // 3600
-            minutes = (seconds % 3600) // 60
-            secs = seconds % 60
-            if hours > 0:
-                return f"{hours}h {minutes}m {secs}s"
-            return f"{minutes}m {secs}s"
-        
         embed = discord.Embed(
             title="📜 Playlist Information",
             description=f"**{pl['title']}**",
@@ -2650,7 +3136,7 @@ class Music(commands.Cog):
         if pl['duration'] > 0:
             embed.add_field(
                 name="⏱️ Total Duration",
-                value=f"`{format_time(pl['duration'])}`",
+                value=f"`{_format_time(pl['duration'])}`",
                 inline=True
             )
         
@@ -2673,11 +3159,10 @@ class Music(commands.Cog):
         )
         
         # Calculate elapsed playlist time
-        import time
-        elapsed_time = int(time.time() - pl['added_at'])
+        elapsed_time = int(_now() - pl['added_at'])
         embed.add_field(
             name="🕒 Playing For",
-            value=f"`{format_time(elapsed_time)}`",
+            value=f"`{_format_time(elapsed_time)}`",
             inline=True
         )
         
@@ -2700,16 +3185,18 @@ class Music(commands.Cog):
             return
         
         async with state.lock:
-            removed_track = state.queue.pop(index - 1)
+            removed_track = state.queue[index - 1]
+            del state.queue[index - 1]
             state.total_tracks -= 1
+        removed_track.release_cache()
         
         await interaction.response.send_message(
             f"🗑️ Removed track #{index}: **{removed_track.title}**",
             ephemeral=True
         )
         
-        # Update embed to reflect queue change
-        await state.update_embed_now()
+        # Update embed to reflect queue change (coalesced with other removals in quick succession)
+        state.request_embed_update()
     
     @app_commands.command(name="pl-jump", description="Jump directly to a specific track in the playlist")
     async def pl_jump(self, interaction: discord.Interaction, index: int):
@@ -2732,7 +3219,7 @@ class Music(commands.Cog):
             tracks_to_remove = index - 1
             for _ in range(tracks_to_remove):
                 if state.queue:
-                    state.queue.pop(0)
+                    state.queue.popleft().release_cache()
             
             # Adjust playlist index
             state.playlist_track_index = state.playlist_track_index + tracks_to_remove
@@ -2763,12 +3250,11 @@ class Music(commands.Cog):
             color=discord.Color.blue()
         )
         
-        history_text = ""
-        recent_history = list(reversed(state.history[-10:]))
-        for i, track in enumerate(recent_history, 1):
-            title = track.title[:40] + "..." if len(track.title) > 40 else track.title
-            history_text += f"`{i:2d}.` **{title}**\n"
-            history_text += f"     📺 `{track.uploader}` • 👤 {track.requester.display_name}\n\n"
+        recent_history = list(itertools.islice(reversed(state.history), 10))
+        history_text = "".join(
+            f"`{i:2d}.` **{track.title_40}**\n     📺 `{track.uploader}` • 👤 {track.requester.display_name}\n\n"
+            for i, track in enumerate(recent_history, 1)
+        )
         
         embed.add_field(name="🎶 Recent Tracks", value=history_text.strip(), inline=False)
         
@@ -2787,18 +3273,21 @@ class Music(commands.Cog):
     @app_commands.describe(from_pos="Current position of the track", to_pos="New position for the track")
     async def move(self, interaction: discord.Interaction, from_pos: int, to_pos: int):
         state = self.get_state(interaction.guild.id)
+        queue = state.queue
+        queue_len = len(queue)
         
-        if len(state.queue) == 0:
+        if queue_len == 0:
             await interaction.response.send_message("❌ Queue is empty.", ephemeral=True)
             return
         
-        if from_pos < 1 or from_pos > len(state.queue) or to_pos < 1 or to_pos > len(state.queue):
-            await interaction.response.send_message(f"❌ Invalid position. Queue has {len(state.queue)} tracks.", ephemeral=True)
+        if not (1 <= from_pos <= queue_len and 1 <= to_pos <= queue_len):
+            await interaction.response.send_message(f"❌ Invalid position. Queue has {queue_len} tracks.", ephemeral=True)
             return
         
         async with state.lock:
-            track = state.queue.pop(from_pos - 1)
-            state.queue.insert(to_pos - 1, track)
+            track = queue[from_pos - 1]
+            del queue[from_pos - 1]
+            queue.insert(to_pos - 1, track)
         
         embed = discord.Embed(
             title="🔄 Track Moved",
@@ -2806,12 +3295,12 @@ class Music(commands.Cog):
             color=discord.Color.blue()
         )
         
-        title = track.title[:45] + "..." if len(track.title) > 45 else track.title
+        title = track.title_45
         embed.add_field(name="🎶 Track", value=f"**{title}**", inline=False)
         embed.add_field(name="📊 From Position", value=f"`#{from_pos}`", inline=True)
         embed.add_field(name="📊 To Position", value=f"`#{to_pos}`", inline=True)
         embed.add_field(name="👤 Requested by", value=track.requester.mention, inline=True)
-        embed.set_footer(text=f"Queue has {len(state.queue)} tracks")
+        embed.set_footer(text=f"Queue has {queue_len} tracks")
         
         await interaction.response.send_message(embed=embed)
     
@@ -2824,17 +3313,19 @@ class Music(commands.Cog):
             await interaction.response.send_message("❌ Bot is not in a voice channel.", ephemeral=True)
             return
         
-        if len(state.queue) == 0:
+        queue = state.queue
+        queue_len = len(queue)
+        if queue_len == 0:
             await interaction.response.send_message("❌ Queue is empty.", ephemeral=True)
             return
         
-        if position < 1 or position > len(state.queue):
-            await interaction.response.send_message(f"❌ Invalid position. Queue has {len(state.queue)} tracks.", ephemeral=True)
+        if not 1 <= position <= queue_len:
+            await interaction.response.send_message(f"❌ Invalid position. Queue has {queue_len} tracks.", ephemeral=True)
             return
         
         async with state.lock:
             for _ in range(position - 1):
-                state.queue.pop(0)
+                queue.popleft().release_cache()
         
         await state.skip()
         await interaction.response.send_message(f"⏩ Jumping to position {position}")
@@ -2851,11 +3342,12 @@ class Music(commands.Cog):
             await interaction.response.send_message("❌ Bot is not in a voice channel.", ephemeral=True)
             return
         
+        current = state.current
         async with state.lock:
-            state.queue.insert(0, state.current)
+            state.queue.appendleft(current)
         
         await state.skip()
-        await interaction.response.send_message(f"🔁 Replaying: **{state.current.title}**")
+        await interaction.response.send_message(f"🔁 Replaying: **{current.title}**")
 
 
 async def setup(bot: commands.Bot):
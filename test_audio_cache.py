@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Test script for the on-disk audio cache.
+This script checks YTDLSource's cache bookkeeping offline, without yt-dlp network access.
+"""
+
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+import utils.yt as yt
+from utils.yt import YTDLSource
+
+INFO = {'title': 'Test Track', 'url': 'file', 'duration': 1, 'thumbnail': None,
+        'webpage_url': 'https://www.youtube.com/watch?v=test', 'uploader': 'Tester'}
+
+@contextmanager
+def cache_source(quota: int):
+    """Yield a YTDLSource whose cache lives in a fresh temp dir with the given quota."""
+    previous_quota = yt.AUDIO_CACHE_MAX_BYTES
+    # Built with the cache off so the real cache dir is never loaded or evicted
+    yt.AUDIO_CACHE_MAX_BYTES = 0
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            source = YTDLSource()
+            source.cache_dir = cache_dir
+            yt.AUDIO_CACHE_MAX_BYTES = quota
+            try:
+                yield source
+            finally:
+                source.close()
+    finally:
+        yt.AUDIO_CACHE_MAX_BYTES = previous_quota
+
+def store(source: YTDLSource, video_id: str, size: int, ext: str = '.m4a') -> dict:
+    """Fake a finished download of `size` bytes and move it into the cache."""
+    download_dir = tempfile.mkdtemp()
+    downloaded_file = os.path.join(download_dir, 'download' + ext)
+    with open(downloaded_file, 'wb') as f:
+        f.write(b'\0' * size)
+    track_info = dict(INFO)
+    track_info['local_file'] = source._store_download(video_id, downloaded_file, download_dir, track_info)
+    assert not os.path.exists(download_dir), "download dir should be removed"
+    return track_info
+
+def release(source: YTDLSource, video_id: str):
+    """Release one hold and wait for the eviction pass on the worker pool."""
+    source.release_cached(video_id)
+    source.executor.shutdown(wait=True)
+    source._executor = None
+
+def test_cache_hit():
+    """A hit returns cache_id and takes a reference."""
+    print("\n📝 Cache hit")
+    with cache_source(1000) as source:
+        store(source, 'aaaaaaaaaaa', 100)
+        release(source, 'aaaaaaaaaaa')
+        assert 'aaaaaaaaaaa' not in source._cache_refs
+        
+        hit = source._get_cached_download('aaaaaaaaaaa')
+        assert hit is not None and hit['cache_id'] == 'aaaaaaaaaaa'
+        assert hit['title'] == INFO['title'] and hit['temp_dir'] is None
+        assert os.path.exists(hit['local_file'])
+        assert source._cache_refs['aaaaaaaaaaa'] == 1
+        assert source._get_cached_download('bbbbbbbbbbb') is None
+    print("   ✅ hit returns cache_id and increments the refcount")
+
+def test_store_race():
+    """A store for an id that is already cached reuses the existing file."""
+    print("\n📝 Concurrent store of the same video")
+    with cache_source(1000) as source:
+        first = store(source, 'aaaaaaaaaaa', 100)
+        second = store(source, 'aaaaaaaaaaa', 150, ext='.webm')
+        assert second['local_file'] == first['local_file']
+        assert second['cache_id'] == 'aaaaaaaaaaa'
+        assert os.path.exists(first['local_file'])
+        assert source._cache_refs['aaaaaaaaaaa'] == 2
+        assert list(source._disk_cache) == ['aaaaaaaaaaa'] and source._disk_cache_bytes == 100
+    print("   ✅ racing store reuses the cached file")
+
+def test_eviction_skips_referenced():
+    """Eviction skips referenced ids and always keeps the newest entry."""
+    print("\n📝 Eviction with referenced entries")
+    with cache_source(150) as source:
+        store(source, 'aaaaaaaaaaa', 100)
+        store(source, 'bbbbbbbbbbb', 100)
+        store(source, 'ccccccccccc', 100)
+        # Everything is held, so nothing can go even though the cache is over quota
+        assert list(source._disk_cache) == ['aaaaaaaaaaa', 'bbbbbbbbbbb', 'ccccccccccc']
+        
+        release(source, 'bbbbbbbbbbb')
+        assert list(source._disk_cache) == ['aaaaaaaaaaa', 'ccccccccccc']
+        
+        release(source, 'ccccccccccc')
+        # Still over quota, but the newest entry is kept and 'a' is still held
+        assert list(source._disk_cache) == ['aaaaaaaaaaa', 'ccccccccccc']
+        assert source._disk_cache_bytes == 200
+    print("   ✅ referenced ids and the newest entry survive eviction")
+
+def test_last_release_evicts():
+    """Releasing the last reference evicts an entry that is over quota."""
+    print("\n📝 Eviction on last release")
+    with cache_source(150) as source:
+        path = store(source, 'aaaaaaaaaaa', 100)['local_file']
+        assert source._get_cached_download('aaaaaaaaaaa') is not None
+        store(source, 'bbbbbbbbbbb', 100)
+        assert source._cache_refs['aaaaaaaaaaa'] == 2
+        
+        release(source, 'aaaaaaaaaaa')
+        assert 'aaaaaaaaaaa' in source._disk_cache and os.path.exists(path)
+        
+        release(source, 'aaaaaaaaaaa')
+        assert 'aaaaaaaaaaa' not in source._disk_cache and not os.path.exists(path)
+        assert not os.path.exists(os.path.join(source.cache_dir, 'aaaaaaaaaaa.json'))
+        assert source._disk_cache_bytes == 100
+    print("   ✅ last release evicts the over-quota entry")
+
+def test_load_order():
+    """_load_disk_cache rebuilds LRU order from file mtimes."""
+    print("\n📝 Rebuilding the index at startup")
+    with cache_source(1000) as source:
+        for video_id, mtime in (('aaaaaaaaaaa', 300), ('bbbbbbbbbbb', 100), ('ccccccccccc', 200)):
+            path = os.path.join(source.cache_dir, video_id + '.m4a')
+            with open(path, 'wb') as f:
+                f.write(b'\0' * 10)
+            with open(os.path.join(source.cache_dir, video_id + '.json'), 'w') as f:
+                f.write('{}')
+            os.utime(path, (mtime, mtime))
+        # A file without a sidecar is not a cache entry
+        with open(os.path.join(source.cache_dir, 'orphan.m4a'), 'wb') as f:
+            f.write(b'\0' * 10)
+        
+        source._load_disk_cache()
+        assert list(source._disk_cache) == ['bbbbbbbbbbb', 'ccccccccccc', 'aaaaaaaaaaa']
+        assert source._disk_cache_bytes == 30
+    print("   ✅ oldest access first after restart")
+
+def main():
+    """Main test function."""
+    print("🎵 Discord Music Bot - Audio Cache Test")
+    print("This script tests the disk cache bookkeeping offline.")
+    
+    # Check if we're in the right directory
+    if not os.path.exists("utils/yt.py"):
+        print("❌ Error: Please run this script from the bot's root directory")
+        print("   Expected: python test_audio_cache.py")
+        sys.exit(1)
+    
+    tests = (test_cache_hit, test_store_race, test_eviction_skips_referenced,
+             test_last_release_evicts, test_load_order)
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"   ❌ {test.__name__} failed: {e}")
+    
+    print("\n" + "=" * 50)
+    if failed:
+        print(f"❌ {failed} of {len(tests)} checks failed")
+        sys.exit(1)
+    print("🎉 All audio cache checks passed!")
+
+if __name__ == "__main__":
+    main()
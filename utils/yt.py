@@ -4,14 +4,25 @@ Handles URL extraction, metadata fetching, and search functionality.
 """
 
 import asyncio
+import concurrent.futures
 import functools
+import json
 import os
+import queue
+import re
 import tempfile
 import shutil
-from typing import Optional, Dict, Any
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
 import yt_dlp
 
 
+# Cookie file for YouTube auth, resolved once at import
+_COOKIE_PATH = os.getenv('YT_COOKIES_PATH', './cookies.txt')
+_COOKIE_FILE = _COOKIE_PATH if os.path.exists(_COOKIE_PATH) else None
+
 # yt-dlp options for extracting audio stream info (streaming mode)
 YTDL_OPTIONS = {
     'format': 'bestaudio/best',
@@ -25,7 +36,7 @@ YTDL_OPTIONS = {
     'source_address': '0.0.0.0',
     'extract_flat': False,  # We need full info, not just IDs
     'skip_download': True,  # We only need the URL, not the file
-    'cookiefile': os.getenv('YT_COOKIES_PATH', './cookies.txt') if os.path.exists(os.getenv('YT_COOKIES_PATH', './cookies.txt')) else None,  # Cookie file for YouTube auth
+    'cookiefile': _COOKIE_FILE,  # Cookie file for YouTube auth
 }
 
 # yt-dlp options for downloading audio files (download-first mode)
@@ -42,12 +53,8 @@ YTDL_DOWNLOAD_OPTIONS = {
     'extract_flat': False,
     'skip_download': False,  # We want to download the file
     'outtmpl': '%(title)s.%(ext)s',  # Will be overridden with temp path
-    'cookiefile': os.getenv('YT_COOKIES_PATH', './cookies.txt') if os.path.exists(os.getenv('YT_COOKIES_PATH', './cookies.txt')) else None,  # Cookie file for YouTube auth
-    'postprocessors': [{
-        'key': 'FFmpegExtractAudio',
-        'preferredcodec': 'mp3',
-        'preferredquality': '192',
-    }],
+    'cookiefile': _COOKIE_FILE,  # Cookie file for YouTube auth
+    # No audio re-encode: FFmpeg plays the m4a/webm container as downloaded
 }
 
 # Fast playlist options - extract only basic info first
@@ -62,9 +69,25 @@ YTDL_PLAYLIST_OPTIONS = {
     'extract_flat': True,  # Fast extraction - gets all entries with basic info
     'skip_download': True,
     'playlistend': None,  # No limit on playlist entries
-    'cookiefile': os.getenv('YT_COOKIES_PATH', './cookies.txt') if os.path.exists(os.getenv('YT_COOKIES_PATH', './cookies.txt')) else None,  # Cookie file for YouTube auth
+    'cookiefile': _COOKIE_FILE,  # Cookie file for YouTube auth
 }
 
+# Worker threads dedicated to blocking yt-dlp calls
+YTDL_MAX_WORKERS = 8
+
+# Track info cache: stream URLs in the result expire, so entries are short-lived
+TRACK_INFO_CACHE_TTL = 300  # seconds
+TRACK_INFO_CACHE_SIZE = 512
+
+# Finished downloads kept on disk for reuse, keyed by YouTube video id (0 disables)
+AUDIO_CACHE_MAX_BYTES = int(os.getenv('AUDIO_CACHE_MB', '0')) * 1024 * 1024
+
+# Track fields stored next to a cached file so a cache hit needs no extraction
+_CACHED_INFO_FIELDS = ('title', 'url', 'duration', 'thumbnail', 'webpage_url', 'uploader')
+
+# Matches the 11-character video id in watch, youtu.be, shorts and embed URLs
+_VIDEO_ID_RE = re.compile(r'(?:youtu\.be/|[?&]v=|/shorts/|/embed/)([A-Za-z0-9_-]{11})')
+
 # FFmpeg options for stable Discord voice streaming
 # Simple, proven configuration that prevents speed and cut issues
 FFMPEG_OPTIONS = {
@@ -91,8 +114,9 @@ class YTDLSource:
     """Wrapper for yt-dlp to extract audio stream information and download files.
     
     Thread Safety: This class uses run_in_executor to run blocking yt-dlp
-    operations in a thread pool, making it safe for concurrent use across
-    multiple guilds. Each extract_info call runs in isolation.
+    operations in its own thread pool, making it safe for concurrent use across
+    multiple guilds without starving the loop's default executor. Each
+    extract_info call runs in isolation.
     
     Download-First Mode: Supports downloading audio files to temporary storage
     for stable playback without streaming issues.
@@ -101,12 +125,45 @@ class YTDLSource:
     def __init__(self):
         self.ytdl = yt_dlp.YoutubeDL(YTDL_OPTIONS)
         self.ytdl_playlist = yt_dlp.YoutubeDL(YTDL_PLAYLIST_OPTIONS)
-        self.ytdl_download = None  # Will be created per download with temp path
+        
+        # Created on first use so close() followed by a cog reload still works
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        
+        # Normalized query -> (monotonic timestamp, track info), oldest first
+        self._info_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
         
         # Create temp directory for audio files
         self.temp_dir = os.path.join(tempfile.gettempdir(), 'discord_bot_audio')
         os.makedirs(self.temp_dir, exist_ok=True)
         print(f"Audio temp directory: {self.temp_dir}")
+        
+        # Disk LRU of finished downloads: video id -> (file path, size in bytes), oldest first
+        self.cache_dir = os.path.join(self.temp_dir, 'cache')
+        self._disk_cache: "OrderedDict[str, Tuple[str, int]]" = OrderedDict()
+        self._disk_cache_bytes = 0
+        # Video id -> number of Tracks still pointing at the cached file
+        self._cache_refs: Dict[str, int] = {}
+        # Guards the cache index; only taken on the worker pool, never by the loop or player threads
+        self._cache_lock = threading.Lock()
+        # Video ids whose Tracks let go, applied to _cache_refs under the lock
+        self._pending_releases: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+        if AUDIO_CACHE_MAX_BYTES > 0:
+            self._load_disk_cache()
+    
+    @property
+    def executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Thread pool used for every blocking yt-dlp call."""
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=YTDL_MAX_WORKERS, thread_name_prefix='ytdl'
+            )
+        return self._executor
+    
+    def close(self):
+        """Shut down the yt-dlp thread pool (called on cog unload)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
     
     async def extract_info(self, url: str, download: bool = False) -> Optional[Dict[str, Any]]:
         """
@@ -119,12 +176,12 @@ class YTDLSource:
         Returns:
             Dictionary containing video metadata and stream URL
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         
         try:
             # Run yt-dlp extraction in thread pool to avoid blocking
             data = await loop.run_in_executor(
-                None,
+                self.executor,
                 functools.partial(self.ytdl.extract_info, url, download=download)
             )
             
@@ -143,16 +200,38 @@ class YTDLSource:
             print(f"Error extracting info from {url}: {e}")
             return None
     
+    @staticmethod
+    def _cache_key(query: str) -> str:
+        """Normalize a query so different URL forms of the same video share a cache entry."""
+        query = query.strip()
+        match = _VIDEO_ID_RE.search(query)
+        if match:
+            return f"id:{match.group(1)}"
+        if query.startswith(('http://', 'https://')):
+            return f"url:{query}"
+        return f"search:{query.lower()}"
+    
     async def get_track_info(self, query: str) -> Optional[Dict[str, Any]]:
         """
         Get track information suitable for playback.
         
+        Results are cached for TRACK_INFO_CACHE_TTL seconds, so re-queued and
+        replayed tracks skip the yt-dlp round-trip.
+        
         Args:
             query: URL or search term
             
         Returns:
             Dictionary with keys: title, url, duration, thumbnail, webpage_url
         """
+        key = self._cache_key(query)
+        cached = self._info_cache.get(key)
+        if cached is not None:
+            if time.monotonic() - cached[0] < TRACK_INFO_CACHE_TTL:
+                self._info_cache.move_to_end(key)
+                return dict(cached[1])
+            del self._info_cache[key]
+        
         data = await self.extract_info(query, download=False)
         
         if not data:
@@ -168,7 +247,12 @@ class YTDLSource:
             'uploader': data.get('uploader', 'Unknown'),
         }
         
-        return track_info
+        self._info_cache[key] = (time.monotonic(), track_info)
+        self._info_cache.move_to_end(key)
+        while len(self._info_cache) > TRACK_INFO_CACHE_SIZE:
+            self._info_cache.popitem(last=False)
+        
+        return dict(track_info)
     
     async def get_playlist_info(self, url: str) -> Optional[Dict[str, Any]]:
         """
@@ -180,12 +264,12 @@ class YTDLSource:
         Returns:
             Dictionary with playlist title and list of video URLs
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         
         try:
             # First, do fast flat extraction to get video IDs
             data = await loop.run_in_executor(
-                None,
+                self.executor,
                 functools.partial(self.ytdl_playlist.extract_info, url, download=False)
             )
             
@@ -234,52 +318,69 @@ class YTDLSource:
         """
         Download audio track to temporary file for stable playback.
         
+        With AUDIO_CACHE_MB set, finished YouTube downloads are kept in a
+        size-capped disk cache and reused when the same video is requested again.
+        
         Args:
             query: URL or search term
             
         Returns:
             Dictionary with track info including local file path
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
+        
+        if AUDIO_CACHE_MAX_BYTES > 0:
+            match = _VIDEO_ID_RE.search(query)
+            if match:
+                # Sidecar read and utime stay off the event loop
+                cached = await loop.run_in_executor(self.executor, self._get_cached_download, match.group(1))
+                if cached:
+                    print(f"Audio cache hit: {cached['title']}")
+                    return cached
         
         try:
             # Create a unique temp directory for this download
             download_dir = tempfile.mkdtemp(dir=self.temp_dir)
             
-            # Configure download options with temp path
-            download_options = YTDL_DOWNLOAD_OPTIONS.copy()
-            download_options['outtmpl'] = os.path.join(download_dir, '%(title)s.%(ext)s')
-            
-            # Create downloader instance
-            ytdl_downloader = yt_dlp.YoutubeDL(download_options)
+            # Configure download options with temp path; YoutubeDL normalizes
+            # and writes into its params, so each instance needs its own dict
+            download_options = {**YTDL_DOWNLOAD_OPTIONS, 'outtmpl': os.path.join(download_dir, '%(title)s.%(ext)s')}
             
-            # Download the track
+            # Build the downloader and download in the worker thread; constructing
+            # YoutubeDL loads cookies and extractors, which shouldn't block the loop
             data = await loop.run_in_executor(
-                None,
-                functools.partial(ytdl_downloader.extract_info, query, download=True)
+                self.executor,
+                functools.partial(self._download_blocking, download_options, query)
             )
             
             if data is None:
-                shutil.rmtree(download_dir, ignore_errors=True)
+                self._discard_dir(download_dir)
                 return None
             
             # If it's a search result, get the first entry
             if 'entries' in data:
                 if len(data['entries']) == 0:
-                    shutil.rmtree(download_dir, ignore_errors=True)
+                    self._discard_dir(download_dir)
                     return None
                 data = data['entries'][0]
             
-            # Find the downloaded file
-            downloaded_file = None
-            for file in os.listdir(download_dir):
-                if file.endswith(('.mp3', '.m4a', '.webm', '.opus')):
-                    downloaded_file = os.path.join(download_dir, file)
-                    break
+            # yt-dlp reports the final path of what it wrote
+            requested = data.get('requested_downloads') or [{}]
+            downloaded_file = requested[0].get('filepath') or data.get('_filename')
+            
+            # Fall back to scanning the download directory
+            if downloaded_file and not os.path.exists(downloaded_file):
+                downloaded_file = None
+            if not downloaded_file:
+                with os.scandir(download_dir) as it:
+                    for entry in it:
+                        if entry.name.endswith(('.mp3', '.m4a', '.webm', '.opus')) and entry.is_file():
+                            downloaded_file = entry.path
+                            break
             
-            if not downloaded_file or not os.path.exists(downloaded_file):
+            if not downloaded_file:
                 print(f"Downloaded file not found in {download_dir}")
-                shutil.rmtree(download_dir, ignore_errors=True)
+                self._discard_dir(download_dir)
                 return None
             
             # Extract relevant fields
@@ -295,6 +396,15 @@ class YTDLSource:
                 'is_downloaded': True,
             }
             
+            # Keep YouTube downloads for reuse; the cache then owns the file
+            if AUDIO_CACHE_MAX_BYTES > 0 and data.get('extractor_key') == 'Youtube' and data.get('id'):
+                downloaded_file = await loop.run_in_executor(
+                    self.executor,
+                    functools.partial(self._store_download, data['id'], downloaded_file, download_dir, track_info)
+                )
+                track_info['local_file'] = downloaded_file
+                track_info['temp_dir'] = None
+            
             print(f"Downloaded: {track_info['title']} -> {downloaded_file}")
             return track_info
             
@@ -302,9 +412,151 @@ class YTDLSource:
             print(f"Error downloading track from {query}: {e}")
             # Cleanup on error
             if 'download_dir' in locals():
-                shutil.rmtree(download_dir, ignore_errors=True)
+                self._discard_dir(download_dir)
             return None
     
+    def _load_disk_cache(self):
+        """Rebuild the disk cache index from files left by previous runs."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        found = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                video_id, ext = os.path.splitext(entry.name)
+                if ext == '.json' or not entry.is_file():
+                    continue
+                if os.path.exists(os.path.join(self.cache_dir, f"{video_id}.json")):
+                    stat = entry.stat()
+                    found.append((stat.st_mtime, video_id, entry.path, stat.st_size))
+        
+        # Oldest access first, so eviction order survives restarts
+        for _, video_id, path, size in sorted(found):
+            self._disk_cache[video_id] = (path, size)
+            self._disk_cache_bytes += size
+        self._evict_disk_cache()
+        print(f"Audio cache: {len(self._disk_cache)} tracks, {self._disk_cache_bytes // (1024 * 1024)} MB")
+    
+    def _discard_dir(self, path: str):
+        """Delete a download directory on the worker pool without waiting for it."""
+        self.executor.submit(shutil.rmtree, path, True)
+    
+    def _drop_cached(self, video_id: str):
+        """Remove one entry from the disk cache and delete its files."""
+        path, size = self._disk_cache.pop(video_id)
+        self._disk_cache_bytes -= size
+        for file in (path, os.path.join(self.cache_dir, f"{video_id}.json")):
+            try:
+                os.remove(file)
+            except OSError:
+                pass
+    
+    def _evict_disk_cache(self):
+        """Drop least recently used downloads until the cache fits its quota."""
+        # Always keep the newest entry, even if it alone is over the quota
+        for video_id in list(self._disk_cache)[:-1]:
+            if self._disk_cache_bytes <= AUDIO_CACHE_MAX_BYTES:
+                break
+            # Files still queued or playing are skipped until they are released
+            if video_id not in self._cache_refs:
+                self._drop_cached(video_id)
+    
+    def release_cached(self, video_id: str):
+        """Drop one Track's hold on a cached file; the eviction pass runs on the worker pool."""
+        self._pending_releases.put(video_id)
+        self.executor.submit(self._drain_releases)
+    
+    def defer_release(self, video_id: str):
+        """Queue a release for the next cache operation; safe to call from a finalizer."""
+        self._pending_releases.put(video_id)
+    
+    def _drain_releases(self):
+        """Apply queued releases and evict what they freed (worker pool only)."""
+        with self._cache_lock:
+            self._apply_releases()
+            self._evict_disk_cache()
+    
+    def _apply_releases(self):
+        """Decrement refcounts for queued releases; call with the cache lock held."""
+        while True:
+            try:
+                video_id = self._pending_releases.get_nowait()
+            except queue.Empty:
+                return
+            refs = self._cache_refs.get(video_id, 0) - 1
+            if refs > 0:
+                self._cache_refs[video_id] = refs
+            else:
+                self._cache_refs.pop(video_id, None)
+    
+    def _acquire_cached(self, video_id: str, track_info: Dict[str, Any]):
+        """Count a new Track reference to a cached file; call with the cache lock held."""
+        self._cache_refs[video_id] = self._cache_refs.get(video_id, 0) + 1
+        track_info['cache_id'] = video_id
+    
+    def is_cached(self, query: str) -> bool:
+        """Whether a URL query names a video already in the disk cache (a lock-free hint)."""
+        if AUDIO_CACHE_MAX_BYTES <= 0:
+            return False
+        match = _VIDEO_ID_RE.search(query)
+        return match is not None and match.group(1) in self._disk_cache
+    
+    def _get_cached_download(self, video_id: str) -> Optional[Dict[str, Any]]:
+        """Return track info for a cached download, or None on a miss; runs on the worker pool."""
+        with self._cache_lock:
+            self._apply_releases()
+            entry = self._disk_cache.get(video_id)
+            if entry is None:
+                return None
+            
+            path = entry[0]
+            try:
+                with open(os.path.join(self.cache_dir, f"{video_id}.json"), encoding='utf-8') as f:
+                    track_info = json.load(f)
+                os.utime(path)  # Record the access for the next startup's ordering
+            except (OSError, ValueError):
+                if video_id not in self._cache_refs:
+                    self._drop_cached(video_id)
+                return None
+            
+            self._disk_cache.move_to_end(video_id)
+            self._acquire_cached(video_id, track_info)
+        # No temp_dir: cached files are owned by the cache, not by the track
+        track_info.update(local_file=path, temp_dir=None, is_downloaded=True)
+        return track_info
+    
+    def _store_download(self, video_id: str, downloaded_file: str, download_dir: str,
+                        track_info: Dict[str, Any]) -> str:
+        """Move a finished download into the disk cache and return its new path; runs on the worker pool."""
+        with self._cache_lock:
+            self._apply_releases()
+            entry = self._disk_cache.get(video_id)
+            if entry is not None:
+                # Another request cached it meanwhile; keep that file, other Tracks may hold it
+                shutil.rmtree(download_dir, True)
+                self._disk_cache.move_to_end(video_id)
+                self._acquire_cached(video_id, track_info)
+                return entry[0]
+            
+            path = os.path.join(self.cache_dir, video_id + os.path.splitext(downloaded_file)[1])
+            os.replace(downloaded_file, path)
+            with open(os.path.join(self.cache_dir, f"{video_id}.json"), 'w', encoding='utf-8') as f:
+                json.dump({field: track_info.get(field) for field in _CACHED_INFO_FIELDS}, f)
+            shutil.rmtree(download_dir, True)
+            
+            size = os.path.getsize(path)
+            self._disk_cache[video_id] = (path, size)
+            self._disk_cache_bytes += size
+            self._acquire_cached(video_id, track_info)
+            self._evict_disk_cache()
+        return path
+    
+    @staticmethod
+    def _download_blocking(options: Dict[str, Any], query: str) -> Optional[Dict[str, Any]]:
+        """Create a downloader for one output path and run it (worker thread only)."""
+        # One instance per download: outtmpl is per-instance, and a shared one
+        # would force concurrent downloads across guilds to take turns
+        with yt_dlp.YoutubeDL(options) as ytdl_downloader:
+            return ytdl_downloader.extract_info(query, download=True)
+    
     def cleanup_track_file(self, track_info: Dict[str, Any]):
         """
         Clean up downloaded track file and temp directory.
@@ -324,28 +576,35 @@ class YTDLSource:
     def cleanup_all_temp_files(self):
         """
         Clean up all temporary audio files (called on bot shutdown).
+        
+        The disk cache directory is kept so cached tracks survive a restart.
         """
         try:
-            if os.path.exists(self.temp_dir):
+            if AUDIO_CACHE_MAX_BYTES > 0 and os.path.exists(self.temp_dir):
+                with os.scandir(self.temp_dir) as it:
+                    for entry in it:
+                        if entry.path != self.cache_dir:
+                            shutil.rmtree(entry.path, ignore_errors=True)
+                print(f"Cleaned up temp audio files, kept cache: {self.cache_dir}")
+            elif os.path.exists(self.temp_dir):
                 shutil.rmtree(self.temp_dir, ignore_errors=True)
                 print(f"Cleaned up all temp audio files: {self.temp_dir}")
         except Exception as e:
             print(f"Error cleaning up all temp files: {e}")
     
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def format_duration(seconds: int) -> str:
-        """Format duration in seconds to HH:MM:SS or MM:SS."""
-        if seconds is None or seconds == 0:
+        """Format duration in seconds to HH:MM:SS or MM:SS (memoized; called on every embed render)."""
+        if not seconds:
             return "Unknown"
         
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        secs = seconds % 60
+        minutes, secs = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
         
-        if hours > 0:
+        if hours:
             return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-        else:
-            return f"{minutes:02d}:{secs:02d}"
+        return f"{minutes:02d}:{secs:02d}"
 
 
 # Global instance